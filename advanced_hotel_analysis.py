@@ -20,7 +20,7 @@ try:
     from src.agents.implementations.developer_agent import DeveloperAgent
     from src.agents.implementations.qa_agent import QAAgent
     from src.agents.base import AgentContext
-    from src.utils import get_logger
+    from src.utils import get_logger, setup_logging
 except ImportError as e:
     print(f"❌ 导入错误: {e}")
     sys.exit(1)
@@ -627,6 +627,7 @@ def print_business_value_analysis(report):
 
 async def main():
     """主函数"""
+    setup_logging()
     print("🤖 AI Agent团队 - 酒店分析工具商业价值飞升分析")
     print("专注于MCP集成、实时数据采集和投资老板痛点解决")
     print("=" * 80)
@@ -17,7 +17,7 @@ from pydantic import BaseModel
 sys.path.insert(0, str(Path(__file__).parent))
 
 from project_launcher import ProjectLauncher
-from src.utils import get_logger
+from src.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
@@ -400,6 +400,7 @@ def get_port_config():
     return 8080, 3000
 
 if __name__ == "__main__":
+    setup_logging()
     backend_port, frontend_port = get_port_config()
     
     print("🚀 启动AI Agent团队API服务器...")
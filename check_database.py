@@ -19,7 +19,7 @@ try:
     import redis
     from src.config.settings import Settings
     from src.core.database.session import DatabaseManager
-    from src.utils import get_logger
+    from src.utils import get_logger, setup_logging
     logger = get_logger(__name__)
 except ImportError as e:
     print(f"⚠️ 导入错误: {e}")
@@ -27,6 +27,7 @@ except ImportError as e:
     # 使用标准库日志
     import logging
     logger = logging.getLogger(__name__)
+    setup_logging = logging.basicConfig
 
 class DatabaseChecker:
     """数据库状态检查器"""
@@ -320,6 +321,7 @@ class DatabaseChecker:
 
 async def main():
     """主函数"""
+    setup_logging()
     checker = DatabaseChecker()
     await checker.run_full_check()
 
@@ -0,0 +1,121 @@
+"""Shared pytest fixtures and hooks for the root agent test scripts.
+
+Run several scripts in one interpreter (and optionally across workers):
+    pytest test_core_system.py test_developer_agent.py
+    pytest -n auto test_core_system.py test_developer_agent.py
+"""
+
+import asyncio
+import functools
+import inspect
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the project packages (src, tests) importable once per session, so
+# the test scripts themselves do not have to touch sys.path
+_ROOT_DIR = Path(__file__).parent
+_ROOT = str(_ROOT_DIR)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+def _is_script(node) -> bool:
+    """Whether a collected node belongs to one of the root test_*.py scripts."""
+    return Path(str(node.path)).parent == _ROOT_DIR
+
+
+def _check_outcome(outcome):
+    """Assert on what a script-style test returned to its __main__ runner.
+    
+    The scripts report rather than raise: a bool, an ``(ok, report)`` pair,
+    a mapping of check name to bool, or report text with a ❌ per failed check.
+    """
+    if outcome is None:
+        return
+    if isinstance(outcome, bool):
+        assert outcome
+    elif isinstance(outcome, tuple):
+        ok, report = outcome
+        assert ok, report
+    elif isinstance(outcome, dict):
+        failed = [name for name, ok in outcome.items() if not ok]
+        assert not failed, f"failed checks: {', '.join(failed)}"
+    elif isinstance(outcome, str):
+        assert "❌" not in outcome, outcome
+
+
+def _asserting(test):
+    """Wrap a test so its returned outcome is checked and not handed to pytest."""
+    if inspect.iscoroutinefunction(test):
+        @functools.wraps(test)
+        async def wrapper(*args, **kwargs):
+            _check_outcome(await test(*args, **kwargs))
+    else:
+        @functools.wraps(test)
+        def wrapper(*args, **kwargs):
+            _check_outcome(test(*args, **kwargs))
+    return wrapper
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Fail script-style tests whose returned report shows a failed check."""
+    if not (isinstance(item, pytest.Function) and _is_script(item)):
+        yield
+        return
+    
+    # Swap the checked test in for this call only, so reruns start from the
+    # original function
+    test = item.obj
+    item.obj = _asserting(test)
+    try:
+        yield
+    finally:
+        item.obj = test
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _script_logging(request):
+    """Keep agent logging to warnings and above in the root test scripts."""
+    if _is_script(request.node):
+        from src.utils import setup_logging
+        setup_logging(log_level="WARNING")
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Use uvloop for the test event loops when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """One Manager Agent shared by the tests of a module."""
+    from src.agents.implementations.manager_agent import ManagerAgent
+    return ManagerAgent("manager-001")
+
+
+@pytest.fixture(scope="module")
+def developer():
+    """One Developer Agent shared by the tests of a module."""
+    from src.agents.implementations.developer_agent import DeveloperAgent
+    return DeveloperAgent("dev-001")
+
+
+@pytest.fixture(scope="module")
+def team():
+    """One AI Agent Team shared by the tests of a module."""
+    from test_team_integration import AIAgentTeam
+    return AIAgentTeam()
+
+
+@pytest.fixture
+def temp_dir(tmp_path) -> str:
+    """Scratch directory for tests that write project files."""
+    return str(tmp_path)
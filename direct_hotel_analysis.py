@@ -20,7 +20,7 @@ try:
     from src.agents.implementations.developer_agent import DeveloperAgent
     from src.agents.implementations.qa_agent import QAAgent
     from src.agents.base import AgentContext
-    from src.utils import get_logger
+    from src.utils import get_logger, setup_logging
 except ImportError as e:
     print(f"❌ 导入错误: {e}")
     print("请确保在AI开发团队项目目录中运行此脚本")
@@ -344,6 +344,7 @@ def print_analysis_report(report):
 
 async def main():
     """主函数"""
+    setup_logging()
     print("🤖 AI Agent团队 - 酒店分析工具项目深度评估")
     print("="*60)
     
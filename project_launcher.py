@@ -19,7 +19,7 @@ from src.agents.implementations.architect_agent import ArchitectAgent
 from src.agents.implementations.developer_agent import DeveloperAgent
 from src.agents.implementations.qa_agent import QAAgent
 from src.agents.base import AgentContext
-from src.utils import get_logger
+from src.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
@@ -331,6 +331,7 @@ class ProjectLauncher:
 async def main():
     """演示项目启动器使用"""
     
+    setup_logging()
     launcher = ProjectLauncher()
     
     # 示例项目配置
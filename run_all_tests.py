@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Run the test scripts in parallel, one interpreter per script.
+
+Usage:
+    python run_all_tests.py                      # every test_*.py in the project root
+    python run_all_tests.py test_core_system.py  # only the given scripts
+"""
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+
+def run_script(script: str) -> subprocess.CompletedProcess:
+    """Run one test script in its own interpreter and capture its output."""
+    return subprocess.run(
+        [sys.executable, script],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+
+def main() -> int:
+    scripts = sys.argv[1:] or sorted(p.name for p in ROOT.glob("test_*.py"))
+    if not scripts:
+        print("No test scripts found")
+        return 1
+
+    # Each worker only waits on its child process, so threads are enough to
+    # keep every script running on its own core
+    with ThreadPoolExecutor(max_workers=min(len(scripts), os.cpu_count() or 1)) as executor:
+        results = list(executor.map(run_script, scripts))
+
+    # Flush buffered output in submission order so reports never interleave
+    failed = []
+    for script, result in zip(scripts, results):
+        sys.stdout.write(f"\n{'=' * 20} {script} {'=' * 20}\n{result.stdout}")
+        if result.returncode != 0:
+            failed.append(script)
+
+    print(f"\n{len(scripts) - len(failed)}/{len(scripts)} scripts passed")
+    for script in failed:
+        print(f"❌ {script}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,7 +11,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.core.memory.bge_embedding import create_embedding_service
-from src.utils import get_logger
+from src.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
@@ -168,6 +168,8 @@ async def performance_benchmark():
 async def main():
     """主函数"""
     
+    setup_logging()
+    
     print("🤖 BGE-M3 Embedding模型安装和测试工具")
     print("=" * 50)
     
@@ -8,13 +8,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.database import init_db
-from src.utils import get_logger
+from src.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
 
 def main():
     """Initialize database."""
+    setup_logging()
     logger.info("Setting up database...")
     
     try:
@@ -16,7 +16,7 @@ from src.agents.implementations.architect_agent import ArchitectAgent
 from src.agents.implementations.developer_agent import DeveloperAgent
 from src.agents.implementations.qa_agent import QAAgent
 from src.agents.base import AgentContext
-from src.utils import get_logger
+from src.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
@@ -394,6 +394,8 @@ async def create_evaluation_report(evaluation: Dict[str, Any]):
 async def main():
     """运行自我评估流程."""
     
+    setup_logging()
+    
     try:
         # 执行评估
         evaluation_result = await analyze_current_project()
@@ -2,10 +2,10 @@
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from datetime import datetime
 import uuid
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.utils import get_logger
 from src.config import settings
@@ -49,6 +49,9 @@ class AgentMessage(BaseModel):
     
 class AgentContext(BaseModel):
     """Context information for agent operations."""
+    # Read-only, so one instance can be shared across tasks and agents
+    model_config = ConfigDict(frozen=True)
+    
     project_id: str
     sprint_id: Optional[str] = None
     task_id: Optional[str] = None
@@ -163,34 +166,62 @@ class BaseAgent(ABC):
     
     async def add_task_context(self, task: Dict[str, Any]) -> None:
         """Add task-specific context."""
-        task_content = f"Task: {task.get('type', 'unknown')}\nDetails: {str(task)}"
-        await self.add_context(
-            task_content, 
-            ContextType.TASK_CONTEXT, 
-            ContextImportance.CRITICAL
-        )
+        await self.add_context(*self._task_context_entry(task))
     
     async def add_conversation_context(self, message: str, from_agent: str = None) -> None:
         """Add conversation context."""
+        await self.add_context(*self._conversation_context_entry(message, from_agent))
+    
+    async def add_decision_context(self, decision: Dict[str, Any]) -> None:
+        """Add decision-making context."""
+        await self.add_context(*self._decision_context_entry(decision))
+    
+    async def add_contexts(self, items: Sequence[Tuple[str, Any]]) -> List[str]:
+        """
+        Add several context entries in one batch.
+        
+        Args:
+            items: (kind, value) pairs. kind is "task", "conversation" or
+                "decision"; a conversation value is a message or a
+                (message, from_agent) tuple.
+            
+        Returns:
+            IDs of the added context items
+        """
+        entries = []
+        for kind, value in items:
+            if kind == "task":
+                entries.append(self._task_context_entry(value))
+            elif kind == "conversation":
+                message, from_agent = (value, None) if isinstance(value, str) else value
+                entries.append(self._conversation_context_entry(message, from_agent))
+            elif kind == "decision":
+                entries.append(self._decision_context_entry(value))
+            else:
+                raise ValueError(f"Unknown context kind: {kind}")
+        
+        return await self.context_manager.add_contexts(entries)
+    
+    def _task_context_entry(self, task: Dict[str, Any]) -> Tuple[str, ContextType, ContextImportance]:
+        """Format a task as a context entry."""
+        task_content = f"Task: {task.get('type', 'unknown')}\nDetails: {str(task)}"
+        return task_content, ContextType.TASK_CONTEXT, ContextImportance.CRITICAL
+    
+    def _conversation_context_entry(
+        self, message: str, from_agent: Optional[str] = None
+    ) -> Tuple[str, ContextType, ContextImportance]:
+        """Format a conversation message as a context entry."""
         if from_agent:
             content = f"Message from {from_agent}: {message}"
         else:
             content = f"Agent {self.agent_id}: {message}"
         
-        await self.add_context(
-            content,
-            ContextType.CONVERSATION,
-            ContextImportance.HIGH
-        )
+        return content, ContextType.CONVERSATION, ContextImportance.HIGH
     
-    async def add_decision_context(self, decision: Dict[str, Any]) -> None:
-        """Add decision-making context."""
+    def _decision_context_entry(self, decision: Dict[str, Any]) -> Tuple[str, ContextType, ContextImportance]:
+        """Format a decision as a context entry."""
         decision_content = f"Decision: {decision.get('decision', '')}\nRationale: {decision.get('rationale', '')}"
-        await self.add_context(
-            decision_content,
-            ContextType.DECISION_HISTORY,
-            ContextImportance.HIGH
-        )
+        return decision_content, ContextType.DECISION_HISTORY, ContextImportance.HIGH
     
     def get_context_stats(self) -> Dict[str, Any]:
         """Get context management statistics."""
@@ -1,15 +1,40 @@
 """Agent implementations."""
 
-from .manager_agent import ManagerAgent
-from .pm_agent import PMAgent
-from .architect_agent import ArchitectAgent
-from .developer_agent import DeveloperAgent
-from .qa_agent import QAAgent
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .manager_agent import ManagerAgent
+    from .pm_agent import PMAgent
+    from .architect_agent import ArchitectAgent
+    from .developer_agent import DeveloperAgent
+    from .qa_agent import QAAgent
+
+# Agents are imported on first access, so importing one implementation
+# module does not load every other agent with it.
+_AGENT_MODULES = {
+    "ManagerAgent": ".manager_agent",
+    "PMAgent": ".pm_agent",
+    "ArchitectAgent": ".architect_agent",
+    "DeveloperAgent": ".developer_agent",
+    "QAAgent": ".qa_agent",
+}
 
 __all__ = [
     "ManagerAgent",
-    "PMAgent", 
+    "PMAgent",
     "ArchitectAgent",
     "DeveloperAgent",
     "QAAgent"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an agent class the first time it is requested."""
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
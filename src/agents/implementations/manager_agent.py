@@ -12,6 +12,9 @@ from src.config import settings
 
 logger = get_logger(__name__)
 
+# Distinct outputs whose validation result a manager keeps
+VALIDATION_CACHE_SIZE = 256
+
 
 class TaskPriority(str, Enum):
     """Task priority levels."""
@@ -52,6 +55,20 @@ class ManagerAgent(BaseAgent):
         self.conflict_history: List[Dict[str, Any]] = []
         self.project_plans: Dict[str, Dict[str, Any]] = {}
         
+        # Validation results keyed by role, standards and output. Validation is
+        # deterministic, so repeated reviews of the same output are lookups.
+        self._validation_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Task type -> handler, so process_task dispatches with one lookup
+        self._task_handlers = {
+            "coordinate": self._coordinate_team,
+            "validate": self._validate_work,
+            "resolve_conflict": self._resolve_conflict,
+            "assign_task": self._assign_task,
+            "sprint_planning": self._conduct_sprint_planning,
+            "project_planning": self._conduct_project_planning,
+        }
+        
         # Initialize quality standards
         self._initialize_quality_standards()
     
@@ -100,22 +117,13 @@ class ManagerAgent(BaseAgent):
         
         self.logger.info(f"Processing management task: {task_type}")
         
+        handler = self._task_handlers.get(task_type)
+        if handler is None:
+            return {"status": "error", "message": f"Unknown task type: {task_type}"}
+        
         try:
-            if task_type == "coordinate":
-                return await self._coordinate_team(task, context)
-            elif task_type == "validate":
-                return await self._validate_work(task, context)
-            elif task_type == "resolve_conflict":
-                return await self._resolve_conflict(task, context)
-            elif task_type == "assign_task":
-                return await self._assign_task(task, context)
-            elif task_type == "sprint_planning":
-                return await self._conduct_sprint_planning(task, context)
-            elif task_type == "project_planning":
-                return await self._conduct_project_planning(task, context)
-            else:
-                return {"status": "error", "message": f"Unknown task type: {task_type}"}
-                
+            return await handler(task, context)
+            
         except Exception as e:
             self.logger.error(f"Error processing task: {str(e)}")
             return {"status": "error", "message": str(e)}
@@ -157,7 +165,7 @@ class ManagerAgent(BaseAgent):
         
         # Get quality standards for this agent role
         standards = self.quality_standards.get(agent_role, {})
-        validation_result = await self._perform_validation(output, standards, agent_role)
+        validation_result = await self._cached_validation(output, standards, agent_role)
         
         # Log validation result
         self.logger.info(f"Validation result for {agent_id}: {validation_result['score']}")
@@ -171,6 +179,34 @@ class ManagerAgent(BaseAgent):
             "approved": validation_result["score"] >= 0.8
         }
     
+    async def _cached_validation(
+        self,
+        output: Dict[str, Any],
+        standards: Dict[str, Any],
+        agent_role: str
+    ) -> Dict[str, Any]:
+        """Validate output, reusing the result for an identical earlier review."""
+        try:
+            key = json.dumps([agent_role, standards, output], sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            # Not serializable as a key (e.g. mixed key types); validate uncached
+            return await self._perform_validation(output, standards, agent_role)
+        
+        cached = self._validation_cache.get(key)
+        if cached is None:
+            cached = await self._perform_validation(output, standards, agent_role)
+            if len(self._validation_cache) >= VALIDATION_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._validation_cache[next(iter(self._validation_cache))]
+            self._validation_cache[key] = cached
+        
+        # Callers get their own details list, so editing it leaves the cache intact
+        return {
+            **cached,
+            "details": list(cached["details"]),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
     async def _perform_validation(
         self,
         output: Dict[str, Any],
@@ -255,7 +291,7 @@ class ManagerAgent(BaseAgent):
             return 0.0
         
         # Simple heuristic: more complete outputs score higher
-        completeness = len([v for v in output.values() if v]) / len(output) if output else 0
+        completeness = sum(map(bool, output.values())) / len(output)
         return min(1.0, completeness + 0.2)  # Add small bonus
     
     async def _resolve_conflict(self, task: Dict[str, Any], context: AgentContext) -> Dict[str, Any]:
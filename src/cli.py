@@ -8,7 +8,7 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from src.config import settings
-from src.utils import get_logger
+from src.utils import get_logger, setup_logging
 
 console = Console()
 logger = get_logger(__name__)
@@ -17,7 +17,7 @@ logger = get_logger(__name__)
 @click.group()
 def cli():
     """AI Agent Team CLI - Manage your AI development team."""
-    pass
+    setup_logging()
 
 
 @cli.command()
@@ -1,8 +1,8 @@
 """Application settings using Pydantic for validation."""
 
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 import os
 from pathlib import Path
 
@@ -29,6 +29,14 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", description="Logging level")
     api_port: int = Field(default=8000, description="API server port")
     api_host: str = Field(default="0.0.0.0", description="API server host")
+    api_workers: Optional[int] = Field(
+        default=None,
+        description="API worker processes in production (defaults to CPU count)"
+    )
+    cors_origins: List[str] = Field(
+        default=["http://localhost:3000", "http://127.0.0.1:3000"],
+        description="Allowed CORS origins"
+    )
     
     # LLM Configuration
     deepseek_api_key: Optional[str] = Field(default=None, description="DeepSeek API key")
@@ -94,6 +102,9 @@ class Settings(BaseSettings):
         description="Mapping of agent types to LLM providers"
     )
     
+    # Provider configs, built on first lookup; settings do not change at runtime
+    _llm_configs: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    
     # Project paths
     @property
     def project_root(self) -> Path:
@@ -120,7 +131,18 @@ class Settings(BaseSettings):
     
     def get_llm_config(self, provider: str) -> Dict[str, Any]:
         """Get LLM configuration for a specific provider."""
-        configs = {
+        configs = self._llm_configs
+        if not configs:
+            configs = self._llm_configs = self._build_llm_configs()
+        
+        if provider not in configs:
+            raise ValueError(f"Unknown LLM provider: {provider}")
+        
+        return configs[provider]
+    
+    def _build_llm_configs(self) -> Dict[str, Dict[str, Any]]:
+        """Build the configuration of every LLM provider."""
+        return {
             "deepseek": {
                 "api_key": self.deepseek_api_key,
                 "base_url": self.deepseek_api_base,
@@ -147,11 +169,6 @@ class Settings(BaseSettings):
                 "api_key": "not-needed",  # LM Studio doesn't require API key
             }
         }
-        
-        if provider not in configs:
-            raise ValueError(f"Unknown LLM provider: {provider}")
-        
-        return configs[provider]
     
     def get_mcp_servers(self, agent_type: str) -> Dict[str, Dict[str, Any]]:
         """Get MCP server configuration for a specific agent type."""
@@ -1,14 +1,15 @@
 """Message bus for agent communication."""
 
 import asyncio
-import json
 import redis.asyncio as redis
 from typing import Dict, Any, List, Optional, Callable, Set
 from datetime import datetime, timedelta
 from enum import Enum
 import uuid
 
-from src.core.communication.protocol import AgentMessage, MessageStatus, MessageType, MessagePriority
+from src.core.communication.protocol import (
+    AgentMessage, MessageStatus, MessageType, MessagePriority, dumps_json, loads_json
+)
 from src.config import settings
 from src.utils import get_logger
 
@@ -81,6 +82,10 @@ class MessageBus:
         self.agent_queues: Dict[str, str] = {}  # agent_id -> queue_name
         self.active_subscriptions: Set[str] = set()
         
+        # Set when a message is queued for an agent, cleared when a receive
+        # drains its queue
+        self._inbox_ready: Dict[str, asyncio.Event] = {}
+        
         # Message tracking
         self.message_tracking: Dict[str, Dict[str, Any]] = {}
         self.delivery_stats = {
@@ -162,6 +167,7 @@ class MessageBus:
         
         self.agent_handlers[agent_id] = handler
         self.agent_queues[agent_id] = queue_name
+        self._inbox_ready.setdefault(agent_id, asyncio.Event())
         
         # Create queue if it doesn't exist
         await self._ensure_queue_exists(queue_name)
@@ -174,6 +180,8 @@ class MessageBus:
         if agent_id in self.agent_handlers:
             del self.agent_handlers[agent_id]
         
+        self._inbox_ready.pop(agent_id, None)
+        
         if agent_id in self.agent_queues:
             queue_name = self.agent_queues[agent_id]
             del self.agent_queues[agent_id]
@@ -250,7 +258,8 @@ class MessageBus:
             "expires_at": (datetime.utcnow() + timedelta(seconds=self.message_ttl_seconds)).isoformat()
         }
         
-        await self.redis_client.lpush(queue_name, json.dumps(message_data))
+        await self.redis_client.lpush(queue_name, dumps_json(message_data))
+        self._inbox_ready[target_agent].set()
         
         # Notify agent (if subscribed)
         await self.redis_client.publish(f"notify_{target_agent}", message.message_id)
@@ -338,19 +347,30 @@ class MessageBus:
             return []
         
         queue_name = self.agent_queues[agent_id]
+        ready = self._inbox_ready.get(agent_id)
         messages = []
         
         try:
-            # Get messages from queue
-            for _ in range(max_messages):
-                # Use blocking pop with timeout
-                result = await self.redis_client.brpop([queue_name], timeout_seconds)
-                
-                if not result:
-                    break  # Timeout reached
-                
-                _, message_data = result
-                message_info = json.loads(message_data)
+            # Clear before popping so a send that lands meanwhile sets it again
+            if ready is not None:
+                ready.clear()
+            
+            # Block only for the first message; once the queue is known to be
+            # non-empty, take the rest in one non-blocking pop
+            result = await self.redis_client.brpop([queue_name], timeout_seconds)
+            if not result:
+                return []  # Timeout reached
+            
+            raw_messages = [result[1]]
+            if max_messages > 1:
+                raw_messages.extend(await self.redis_client.rpop(queue_name, max_messages - 1) or [])
+            
+            # A full batch may have left messages behind
+            if len(raw_messages) == max_messages and ready is not None:
+                ready.set()
+            
+            for message_data in raw_messages:
+                message_info = loads_json(message_data)
                 
                 # Check if message has expired
                 expires_at = datetime.fromisoformat(message_info["expires_at"])
@@ -373,6 +393,30 @@ class MessageBus:
             self.logger.error(f"Failed to receive messages for {agent_id}: {str(e)}")
             return []
     
+    async def wait_for_messages(self, agent_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until a message has been queued for an agent.
+        
+        Returns immediately if the agent's inbox is already non-empty.
+        
+        Args:
+            agent_id: Agent whose inbox to wait on
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if a message is pending, False on timeout or unknown agent
+        """
+        
+        ready = self._inbox_ready.get(agent_id)
+        if ready is None:
+            return False
+        
+        try:
+            await asyncio.wait_for(ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    
     async def process_agent_messages(self, agent_id: str) -> None:
         """Process all pending messages for an agent."""
         
@@ -565,7 +609,7 @@ class MessageBus:
             "reason": "max_retry_attempts_exceeded"
         }
         
-        await self.redis_client.lpush(self.dead_letter_queue, json.dumps(dead_letter_data))
+        await self.redis_client.lpush(self.dead_letter_queue, dumps_json(dead_letter_data))
         self.delivery_stats["messages_failed"] += 1
         
         self.logger.warning(f"Moved message {message.message_id} to dead letter queue")
\ No newline at end of file
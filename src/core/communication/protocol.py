@@ -11,6 +11,20 @@ from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Messages are serialized on every dispatch; use orjson's C encoder when it is
+# installed and fall back to the stdlib otherwise.
+try:
+    import orjson
+    
+    def dumps_json(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    loads_json = orjson.loads
+except ImportError:
+    dumps_json = json.dumps
+    loads_json = json.loads
+
 
 class MessageType(str, Enum):
     """Types of messages between agents."""
@@ -152,12 +166,12 @@ class AgentMessage:
     
     def to_json(self) -> str:
         """Convert message to JSON string."""
-        return json.dumps(self.to_dict())
+        return dumps_json(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'AgentMessage':
         """Create message from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(loads_json(json_str))
     
     def is_expired(self) -> bool:
         """Check if message has expired."""
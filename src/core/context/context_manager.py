@@ -7,7 +7,7 @@ by implementing adaptive context management strategies for AI agents.
 
 import json
 import hashlib
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass, asdict
@@ -255,25 +255,45 @@ class AdaptiveContextManager:
                          importance: ContextImportance = ContextImportance.MEDIUM) -> str:
         """Add new context with automatic management."""
         
-        # Create context item
-        item_id = hashlib.md5(f"{content}{datetime.utcnow()}".encode()).hexdigest()[:12]
-        semantic_hash = hashlib.md5(content.encode()).hexdigest()
-        
-        context_item = ContextItem(
-            id=item_id,
-            content=content,
-            context_type=context_type,
-            importance=importance,
-            created_at=datetime.utcnow(),
-            last_accessed=datetime.utcnow(),
-            access_count=1,
-            semantic_hash=semantic_hash,
-            token_count=len(content.split()) * 1.3  # Approximate token count
-        )
+        item_ids = await self.add_contexts([(content, context_type, importance)])
+        return item_ids[0]
+    
+    async def add_contexts(
+        self,
+        entries: Sequence[Tuple[str, ContextType, ContextImportance]]
+    ) -> List[str]:
+        """
+        Add several context items, then check for degradation once.
+        
+        Args:
+            entries: (content, context_type, importance) triples
+            
+        Returns:
+            IDs of the added context items, in input order
+        """
         
-        self.context_items[item_id] = context_item
+        item_ids = []
+        for content, context_type, importance in entries:
+            # Create context item
+            item_id = hashlib.md5(f"{content}{datetime.utcnow()}".encode()).hexdigest()[:12]
+            semantic_hash = hashlib.md5(content.encode()).hexdigest()
+            
+            context_item = ContextItem(
+                id=item_id,
+                content=content,
+                context_type=context_type,
+                importance=importance,
+                created_at=datetime.utcnow(),
+                last_accessed=datetime.utcnow(),
+                access_count=1,
+                semantic_hash=semantic_hash,
+                token_count=len(content.split()) * 1.3  # Approximate token count
+            )
+            
+            self.context_items[item_id] = context_item
+            item_ids.append(item_id)
         
-        # Check for context degradation
+        # Check for context degradation over the whole batch
         degradation_assessment = await self.context_rot_mitigator.detect_context_degradation(
             list(self.context_items.values())
         )
@@ -282,9 +302,9 @@ class AdaptiveContextManager:
         if degradation_assessment["overall_risk"] > 0.7:
             await self._apply_mitigation_strategies(degradation_assessment)
         
-        self.logger.info(f"Added context item {item_id}, total items: {len(self.context_items)}")
+        self.logger.info(f"Added context items {', '.join(item_ids)}, total items: {len(self.context_items)}")
         
-        return item_id
+        return item_ids
     
     async def get_optimized_context(self, query_context: str = "", 
                                   max_tokens: Optional[int] = None) -> Dict[str, Any]:
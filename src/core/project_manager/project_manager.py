@@ -2,8 +2,10 @@
 
 import asyncio
 import json
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Set
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
 
@@ -14,6 +16,10 @@ from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Synchronous SQLAlchemy calls run here to keep the event loop free. One pool
+# is shared by every ProjectManager, so instances do not each own threads.
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="project-db")
+
 
 class ProjectPriority(str, Enum):
     """Project priority levels."""
@@ -23,6 +29,15 @@ class ProjectPriority(str, Enum):
     LOW = "low"
 
 
+# Sort rank per priority (lower sorts first)
+PRIORITY_RANK = {
+    ProjectPriority.CRITICAL: 0,
+    ProjectPriority.HIGH: 1,
+    ProjectPriority.MEDIUM: 2,
+    ProjectPriority.LOW: 3
+}
+
+
 @dataclass
 class ProjectConfig:
     """Project configuration."""
@@ -59,7 +74,11 @@ class ProjectManager:
         # Active project tracking
         self.active_projects: Dict[str, Dict[str, Any]] = {}
         self.agent_allocations: Dict[str, List[AgentAllocation]] = {}  # agent_id -> allocations
+        self.active_allocations: Dict[str, Dict[str, AgentAllocation]] = {}  # agent_id -> project_id -> allocation
+        self.agent_total_allocation: Dict[str, float] = {}  # agent_id -> sum of active allocations
+        self.agent_roles: Dict[str, str] = {}  # agent_id -> role, cached until invalidate_agent_roles
         self.project_priorities: Dict[str, ProjectPriority] = {}
+        self.project_rank: Dict[str, int] = {}  # project_id -> priority sort rank
         
         # Resource limits
         self.max_concurrent_projects = 10
@@ -98,10 +117,11 @@ class ProjectManager:
             raise ValueError(f"Maximum concurrent projects ({self.max_concurrent_projects}) reached")
         
         # Create project in database
-        project_id = DatabaseManager.create_project(
-            name=config.name,
-            description=config.description,
-            project_type=config.project_type
+        project_id = await self._run_db(
+            DatabaseManager.create_project,
+            config.name,
+            config.description,
+            config.project_type
         )
         
         # Initialize project state
@@ -109,7 +129,7 @@ class ProjectManager:
             "id": project_id,
             "config": config,
             "status": "active",
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": datetime.utcnow(),
             "team_members": initial_team or [],
             "current_sprint": None,
             "resource_allocation": {},
@@ -118,6 +138,7 @@ class ProjectManager:
         
         self.active_projects[project_id] = project_state
         self.project_priorities[project_id] = config.priority
+        self.project_rank[project_id] = PRIORITY_RANK.get(config.priority, 4)
         
         # Allocate initial team if provided
         if initial_team:
@@ -162,8 +183,12 @@ class ProjectManager:
             self.logger.error(f"Project not found: {project_id}")
             return False
         
+        # Resolve role once; later assignments use the cached value
+        if agent_id not in self.agent_roles:
+            self.agent_roles[agent_id] = await self._get_agent_role(agent_id)
+        
         # Check agent capacity
-        if not await self._check_agent_capacity(agent_id, allocation_percentage):
+        if not self._check_agent_capacity(agent_id, allocation_percentage):
             self.logger.warning(f"Agent {agent_id} exceeds capacity with new allocation")
             return False
         
@@ -174,15 +199,16 @@ class ProjectManager:
             return False
         
         # Create allocation
+        now = datetime.utcnow()
         end_date = None
         if duration_days:
-            end_date = datetime.utcnow().replace(day=datetime.utcnow().day + duration_days)
+            end_date = now + timedelta(days=duration_days)
         
         allocation = AgentAllocation(
             agent_id=agent_id,
-            role=await self._get_agent_role(agent_id),
+            role=self.agent_roles[agent_id],
             allocation_percentage=allocation_percentage,
-            start_date=datetime.utcnow(),
+            start_date=now,
             end_date=end_date
         )
         
@@ -191,6 +217,16 @@ class ProjectManager:
             self.agent_allocations[agent_id] = []
         self.agent_allocations[agent_id].append(allocation)
         
+        project_allocations = self.active_allocations.setdefault(agent_id, {})
+        previous = project_allocations.get(project_id)
+        if previous:
+            previous.end_date = allocation.start_date
+            self.agent_total_allocation[agent_id] -= previous.allocation_percentage
+        project_allocations[project_id] = allocation
+        self.agent_total_allocation[agent_id] = (
+            self.agent_total_allocation.get(agent_id, 0.0) + allocation_percentage
+        )
+        
         # Update project team
         if agent_id not in current_team:
             current_team.append(agent_id)
@@ -221,10 +257,10 @@ class ProjectManager:
             del project_state["resource_allocation"][agent_id]
         
         # End agent allocation
-        if agent_id in self.agent_allocations:
-            for allocation in self.agent_allocations[agent_id]:
-                if allocation.end_date is None:  # Active allocation
-                    allocation.end_date = datetime.utcnow()
+        allocation = self.active_allocations.get(agent_id, {}).pop(project_id, None)
+        if allocation:
+            allocation.end_date = datetime.utcnow()
+            self.agent_total_allocation[agent_id] -= allocation.allocation_percentage
         
         self.logger.info(f"Removed {agent_id} from project {project_id}")
         return True
@@ -280,36 +316,25 @@ class ProjectManager:
         
         project_state = self.active_projects[project_id]
         
+        # Team statuses, sprint details and health metrics are independent reads
+        team_members = list(project_state["team_members"])
+        agent_statuses, current_sprint, health_metrics = await asyncio.gather(
+            self._get_agent_statuses(team_members),
+            self._get_sprint_info(project_state["current_sprint"]),
+            self._calculate_project_health(project_id)
+        )
+        
         # Get team status
         team_status = {}
-        for agent_id in project_state["team_members"]:
-            allocation = self.agent_allocations.get(agent_id, [])
-            active_allocation = next((a for a in allocation if a.end_date is None), None)
+        for agent_id in team_members:
+            allocation = self.active_allocations.get(agent_id, {}).get(project_id)
             
             team_status[agent_id] = {
-                "role": active_allocation.role if active_allocation else "unknown",
-                "allocation": active_allocation.allocation_percentage if active_allocation else 0.0,
-                "status": await self._get_agent_status(agent_id)
+                "role": allocation.role if allocation else "unknown",
+                "allocation": allocation.allocation_percentage if allocation else 0.0,
+                "status": agent_statuses.get(agent_id, "unknown")
             }
         
-        # Get sprint information
-        current_sprint = None
-        if project_state["current_sprint"]:
-            with get_db_context() as db:
-                sprint = db.query(Sprint).filter_by(id=project_state["current_sprint"]).first()
-                if sprint:
-                    current_sprint = {
-                        "id": str(sprint.id),
-                        "name": sprint.name,
-                        "goal": sprint.goal,
-                        "status": sprint.status.value,
-                        "start_date": sprint.start_date.isoformat() if sprint.start_date else None,
-                        "end_date": sprint.end_date.isoformat() if sprint.end_date else None
-                    }
-        
-        # Calculate project health metrics
-        health_metrics = await self._calculate_project_health(project_id)
-        
         return {
             "project_id": project_id,
             "name": project_state["config"].name,
@@ -337,28 +362,25 @@ class ProjectManager:
                     "priority": status["priority"],
                     "team_size": len(status["team_status"]),
                     "health_score": status["health_metrics"]["overall_score"],
-                    "resource_utilization": status["resource_utilization"]["total_utilization"]
+                    "resource_utilization": status["resource_utilization"]["total_utilization"],
+                    "_rank": self.project_rank[project_id],
+                    "_neg_health": -status["health_metrics"]["overall_score"]  # Higher health score first
                 }
                 projects.append(summary)
         
         # Sort by priority and health
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        projects.sort(
-            key=lambda p: (
-                priority_order.get(p["priority"], 4),
-                -p["health_score"]  # Higher health score first
-            )
-        )
+        projects.sort(key=operator.itemgetter("_rank", "_neg_health"))
+        
+        for summary in projects:
+            del summary["_rank"], summary["_neg_health"]
         
         return projects
     
     async def get_agent_workload(self, agent_id: str) -> Dict[str, Any]:
         """Get agent's current workload across all projects."""
         
-        allocations = self.agent_allocations.get(agent_id, [])
-        active_allocations = [a for a in allocations if a.end_date is None]
-        
-        total_allocation = sum(a.allocation_percentage for a in active_allocations)
+        self._expire_allocations(agent_id)
+        total_allocation = self.agent_total_allocation.get(agent_id, 0.0)
         
         workload = {
             "agent_id": agent_id,
@@ -368,25 +390,31 @@ class ProjectManager:
             "projects": []
         }
         
-        for allocation in active_allocations:
-            # Find project for this allocation
-            project_info = None
-            for pid, pstate in self.active_projects.items():
-                if agent_id in pstate["team_members"]:
-                    project_info = {
-                        "project_id": pid,
-                        "project_name": pstate["config"].name,
-                        "allocation_percentage": allocation.allocation_percentage,
-                        "role": allocation.role,
-                        "start_date": allocation.start_date.isoformat()
-                    }
-                    break
-            
-            if project_info:
-                workload["projects"].append(project_info)
+        for project_id, allocation in self.active_allocations.get(agent_id, {}).items():
+            project_state = self.active_projects.get(project_id)
+            if project_state:
+                workload["projects"].append({
+                    "project_id": project_id,
+                    "project_name": project_state["config"].name,
+                    "allocation_percentage": allocation.allocation_percentage,
+                    "role": allocation.role,
+                    "start_date": allocation.start_date.isoformat()
+                })
         
         return workload
     
+    def invalidate_agent_roles(self, agent_id: Optional[str] = None) -> None:
+        """Drop cached agent roles so the next lookup reads them from the database.
+        
+        Call after changing an agent's role; without agent_id every cached role
+        is dropped.
+        """
+        
+        if agent_id is None:
+            self.agent_roles.clear()
+        else:
+            self.agent_roles.pop(agent_id, None)
+    
     async def optimize_resource_allocation(self) -> Dict[str, Any]:
         """Optimize agent allocation across projects."""
         
@@ -399,6 +427,12 @@ class ProjectManager:
             "project_resource_gaps": []
         }
         
+        # Resolve every agent role up front with at most one database query
+        agent_ids = set(self.agent_allocations)
+        for project_state in self.active_projects.values():
+            agent_ids.update(project_state["team_members"])
+        role_map = await self._get_agent_roles(agent_ids)
+        
         # Check for overallocated agents
         for agent_id in self.agent_allocations:
             workload = await self.get_agent_workload(agent_id)
@@ -420,11 +454,7 @@ class ProjectManager:
         # Check for project resource gaps
         for project_id, project_state in self.active_projects.items():
             required_roles = self._get_required_roles(project_state["config"])
-            current_roles = set()
-            
-            for agent_id in project_state["team_members"]:
-                role = await self._get_agent_role(agent_id)
-                current_roles.add(role)
+            current_roles = {role_map[agent_id] for agent_id in project_state["team_members"]}
             
             missing_roles = required_roles - current_roles
             if missing_roles:
@@ -436,7 +466,7 @@ class ProjectManager:
                 })
         
         # Generate reallocation suggestions
-        await self._generate_reallocation_suggestions(optimization_results)
+        self._generate_reallocation_suggestions(optimization_results, role_map)
         
         return optimization_results
     
@@ -453,17 +483,16 @@ class ProjectManager:
             project_state = self.active_projects[project_id]
             project_state["status"] = "paused"
             project_state["pause_reason"] = reason
-            project_state["paused_at"] = datetime.utcnow().isoformat()
-            
-            # Save all agent contexts
-            for agent_id in project_state["team_members"]:
-                await self._save_agent_context(agent_id, project_id)
+            project_state["paused_at"] = datetime.utcnow()
             
-            # Update database
-            with get_db_context() as db:
-                project = db.query(Project).filter_by(id=project_id).first()
-                if project:
-                    project.status = ProjectStatus.PAUSED
+            # Save all agent contexts and update database concurrently
+            await asyncio.gather(
+                self._update_project_status_db(project_id, ProjectStatus.PAUSED),
+                *[
+                    self._save_agent_context(agent_id, project_id)
+                    for agent_id in list(project_state["team_members"])
+                ]
+            )
             
             self.logger.info(f"Project {project_id} paused successfully")
             return True
@@ -487,7 +516,7 @@ class ProjectManager:
         try:
             # Restore project state
             project_state["status"] = "active"
-            project_state["resumed_at"] = datetime.utcnow().isoformat()
+            project_state["resumed_at"] = datetime.utcnow()
             
             # Check if team members are available
             available_agents = []
@@ -496,15 +525,14 @@ class ProjectManager:
                 if workload["total_allocation"] < 1.0:  # Has capacity
                     available_agents.append(agent_id)
             
-            # Restore contexts for available agents
-            for agent_id in available_agents:
-                await self._load_agent_context(agent_id, project_id)
-            
-            # Update database
-            with get_db_context() as db:
-                project = db.query(Project).filter_by(id=project_id).first()
-                if project:
-                    project.status = ProjectStatus.ACTIVE
+            # Restore contexts for available agents and update database concurrently
+            await asyncio.gather(
+                self._update_project_status_db(project_id, ProjectStatus.ACTIVE),
+                *[
+                    self._load_agent_context(agent_id, project_id)
+                    for agent_id in available_agents
+                ]
+            )
             
             self.logger.info(f"Project {project_id} resumed with {len(available_agents)} agents")
             return True
@@ -521,32 +549,101 @@ class ProjectManager:
         for agent_id in agent_ids:
             await self.assign_agent_to_project(project_id, agent_id, 1.0)
     
-    async def _check_agent_capacity(self, agent_id: str, additional_allocation: float) -> bool:
+    def _check_agent_capacity(self, agent_id: str, additional_allocation: float) -> bool:
         """Check if agent has capacity for additional allocation."""
         
-        current_workload = await self.get_agent_workload(agent_id)
-        new_total = current_workload["total_allocation"] + additional_allocation
+        self._expire_allocations(agent_id)
+        new_total = self.agent_total_allocation.get(agent_id, 0.0) + additional_allocation
         
-        # Get agent role to check role-specific limits
-        role = await self._get_agent_role(agent_id)
-        role_limit = self.agent_capacity_limits.get(role, 1.0)
+        # Role-specific limits use the cached role map
+        role_limit = self.agent_capacity_limits.get(self.agent_roles.get(agent_id, "unknown"), 1.0)
         
         return new_total <= role_limit
     
+    def _expire_allocations(self, agent_id: str) -> None:
+        """Release timed allocations whose end date has passed."""
+        
+        project_allocations = self.active_allocations.get(agent_id)
+        if not project_allocations:
+            return
+        
+        now = datetime.utcnow()
+        for project_id, allocation in list(project_allocations.items()):
+            if allocation.end_date is not None and allocation.end_date <= now:
+                del project_allocations[project_id]
+                self.agent_total_allocation[agent_id] -= allocation.allocation_percentage
+    
+    async def _run_db(self, func, *args):
+        """Run a blocking database helper in the database executor."""
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_DB_EXECUTOR, func, *args)
+    
     async def _get_agent_role(self, agent_id: str) -> str:
         """Get agent role from database."""
         
+        return await self._run_db(self._get_agent_role_sync, agent_id)
+    
+    def _get_agent_role_sync(self, agent_id: str) -> str:
+        """Get agent role from database (blocking operation)."""
+        
         with get_db_context() as db:
             agent = db.query(Agent).filter_by(id=agent_id).first()
             return agent.role if agent else "unknown"
     
+    async def _get_agent_roles(self, agent_ids: Set[str]) -> Dict[str, str]:
+        """Get roles for several agents, querying only those not yet cached."""
+        
+        missing = [agent_id for agent_id in agent_ids if agent_id not in self.agent_roles]
+        if missing:
+            fetched = await self._run_db(self._get_agent_roles_sync, missing)
+            for agent_id in missing:
+                self.agent_roles[agent_id] = fetched.get(agent_id, "unknown")
+        
+        return {agent_id: self.agent_roles[agent_id] for agent_id in agent_ids}
+    
+    def _get_agent_roles_sync(self, agent_ids: List[str]) -> Dict[str, str]:
+        """Get roles for several agents (blocking operation)."""
+        
+        with get_db_context() as db:
+            rows = db.query(Agent.id, Agent.role).filter(Agent.id.in_(agent_ids)).all()
+            return {agent_id: role for agent_id, role in rows}
+    
     async def _get_agent_status(self, agent_id: str) -> str:
         """Get current agent status."""
         
+        return await self._run_db(self._get_agent_status_sync, agent_id)
+    
+    def _get_agent_status_sync(self, agent_id: str) -> str:
+        """Get current agent status (blocking operation)."""
+        
         with get_db_context() as db:
             agent = db.query(Agent).filter_by(id=agent_id).first()
             return agent.current_status if agent else "unknown"
     
+    async def _get_sprint_info(self, sprint_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get sprint summary from database."""
+        
+        if not sprint_id:
+            return None
+        return await self._run_db(self._get_sprint_info_sync, sprint_id)
+    
+    def _get_sprint_info_sync(self, sprint_id: str) -> Optional[Dict[str, Any]]:
+        """Get sprint summary from database (blocking operation)."""
+        
+        with get_db_context() as db:
+            sprint = db.query(Sprint).filter_by(id=sprint_id).first()
+            if not sprint:
+                return None
+            return {
+                "id": str(sprint.id),
+                "name": sprint.name,
+                "goal": sprint.goal,
+                "status": sprint.status.value,
+                "start_date": sprint.start_date.isoformat() if sprint.start_date else None,
+                "end_date": sprint.end_date.isoformat() if sprint.end_date else None
+            }
+    
     async def _save_agent_context(self, agent_id: str, project_id: str) -> None:
         """Save agent's current context for a project."""
         
@@ -560,14 +657,46 @@ class ProjectManager:
         # This would restore agent context from memory system
         self.logger.info(f"Loading context for {agent_id} in project {project_id}")
     
+    async def _get_agent_statuses(self, agent_ids: List[str]) -> Dict[str, str]:
+        """Get current status for several agents with a single query."""
+        
+        if not agent_ids:
+            return {}
+        return await self._run_db(self._get_agent_statuses_sync, agent_ids)
+    
+    def _get_agent_statuses_sync(self, agent_ids: List[str]) -> Dict[str, str]:
+        """Get current status for several agents (blocking operation)."""
+        
+        with get_db_context() as db:
+            rows = db.query(Agent.id, Agent.current_status).filter(Agent.id.in_(agent_ids)).all()
+            return {agent_id: status for agent_id, status in rows}
+    
     async def _update_agent_current_project(self, agent_id: str, project_id: str) -> None:
         """Update agent's current project in database."""
         
+        await self._run_db(self._update_agent_current_project_sync, agent_id, project_id)
+    
+    def _update_agent_current_project_sync(self, agent_id: str, project_id: str) -> None:
+        """Update agent's current project in database (blocking operation)."""
+        
         with get_db_context() as db:
             agent = db.query(Agent).filter_by(id=agent_id).first()
             if agent:
                 agent.current_project_id = project_id
     
+    async def _update_project_status_db(self, project_id: str, status: ProjectStatus) -> None:
+        """Update project status in database without blocking the event loop."""
+        
+        await self._run_db(self._update_project_status_sync, project_id, status)
+    
+    def _update_project_status_sync(self, project_id: str, status: ProjectStatus) -> None:
+        """Update project status in database (blocking operation)."""
+        
+        with get_db_context() as db:
+            project = db.query(Project).filter_by(id=project_id).first()
+            if project:
+                project.status = status
+    
     async def _calculate_project_health(self, project_id: str) -> Dict[str, Any]:
         """Calculate project health metrics."""
         
@@ -609,28 +738,25 @@ class ProjectManager:
         
         return base_roles
     
-    async def _generate_reallocation_suggestions(self, optimization_results: Dict[str, Any]) -> None:
+    def _generate_reallocation_suggestions(
+        self,
+        optimization_results: Dict[str, Any],
+        role_map: Dict[str, str]
+    ) -> None:
         """Generate suggestions for resource reallocation."""
         
         suggestions = []
         
-        # Match underutilized agents with projects needing resources
-        underutilized = optimization_results["underutilized_agents"]
-        resource_gaps = optimization_results["project_resource_gaps"]
+        # Index underutilized agents by role
+        underutilized_by_role: Dict[str, List[Dict[str, Any]]] = {}
+        for agent_info in optimization_results["underutilized_agents"]:
+            role = role_map.get(agent_info["agent_id"], "unknown")
+            underutilized_by_role.setdefault(role, []).append(agent_info)
         
-        for gap in resource_gaps:
+        # Match underutilized agents with projects needing resources
+        for gap in optimization_results["project_resource_gaps"]:
             for missing_role in gap["missing_roles"]:
-                # Find underutilized agents with this role
-                suitable_agents = []
-                for agent_info in underutilized:
-                    agent_id = agent_info["agent_id"]
-                    agent_role = await self._get_agent_role(agent_id)
-                    
-                    if agent_role == missing_role:
-                        suitable_agents.append({
-                            "agent_id": agent_id,
-                            "available_capacity": agent_info["available_capacity"]
-                        })
+                suitable_agents = underutilized_by_role.get(missing_role)
                 
                 if suitable_agents:
                     # Suggest the agent with most capacity
@@ -646,4 +772,4 @@ class ProjectManager:
                         "reason": f"Fill missing {missing_role} role"
                     })
         
-        optimization_results["reallocation_suggestions"] = suggestions
\ No newline at end of file
+        optimization_results["reallocation_suggestions"] = suggestions
@@ -1,15 +1,19 @@
 """Main application entry point."""
 
 import asyncio
+import importlib.util
+import os
+import sys
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from src.config import settings
-from src.utils import get_logger
+from src.utils import get_logger, setup_logging
 from src.core.database import init_db
 
 logger = get_logger(__name__)
@@ -19,6 +23,7 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
+    setup_logging()
     logger.info("Starting AI Agent Team API...")
     
     # Initialize database
@@ -41,12 +46,13 @@ app = FastAPI(
     description="API for managing AI agent development teams",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -141,11 +147,34 @@ async def register_agent(
 
 def run_server():
     """Run the FastAPI server."""
+    if settings.app_env == "development":
+        # Single process with file watcher for local development
+        uvicorn.run(
+            "src.main:app",
+            host=settings.api_host,
+            port=settings.api_port,
+            reload=True,
+            log_level=settings.log_level.lower(),
+        )
+        return
+    
+    # Production: no reload watcher, one worker per CPU, fast loop/parser on Linux
+    loop = "auto"
+    http = "auto"
+    if sys.platform.startswith("linux"):
+        if importlib.util.find_spec("uvloop") is not None:
+            loop = "uvloop"
+        if importlib.util.find_spec("httptools") is not None:
+            http = "httptools"
+    
     uvicorn.run(
         "src.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=settings.app_env == "development",
+        reload=False,
+        workers=settings.api_workers or os.cpu_count() or 1,
+        loop=loop,
+        http=http,
         log_level=settings.log_level.lower(),
     )
 
@@ -1,11 +1,58 @@
 """Logging configuration for AI Agent Team."""
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-from loguru import logger
+from typing import TYPE_CHECKING, Optional, Set
 
-from src.config import settings
+# loguru and settings are imported inside the functions so that modules
+# which only call get_logger() do not pay for them at import time.
+if TYPE_CHECKING:
+    from loguru import Logger
+
+# Format templates are parsed once by loguru when the sink is added. The time
+# field uses a strftime spec so each record is rendered by datetime.strftime
+# rather than loguru's token substitution.
+_FMT_CONSOLE = (
+    "<green>{time:%Y-%m-%d %H:%M:%S}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+_FMT_PLAIN = "{time:%Y-%m-%d %H:%M:%S} | {level: <8} | {name}:{function}:{line} - {message}"
+
+# Set once setup_logging has configured the sinks
+_initialized = False
+
+# Directories already created by this process
+_ensured_dirs: Set[Path] = set()
+
+# Compresses rotated log files off the logging thread
+_compressor: Optional[ThreadPoolExecutor] = None
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _zip_file(path: str) -> None:
+    """Zip a rotated log file and remove the original."""
+    import zipfile
+    
+    with zipfile.ZipFile(f"{path}.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.write(path, os.path.basename(path))
+    os.remove(path)
+
+
+def _compress_in_background(path: str) -> None:
+    """Rotation compression hook that returns immediately."""
+    global _compressor
+    
+    if _compressor is None:
+        _compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logzip")
+    _compressor.submit(_zip_file, path)
 
 
 def setup_logging(
@@ -19,6 +66,15 @@ def setup_logging(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
     """
+    global _initialized
+    
+    # Already configured and no overrides requested
+    if _initialized and log_level is None and log_file is None:
+        return
+    
+    from loguru import logger
+    from src.config import settings
+    
     # Remove default logger
     logger.remove()
     
@@ -29,54 +85,38 @@ def setup_logging(
     logger.add(
         sys.stdout,
         level=level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        format=_FMT_CONSOLE,
         colorize=True,
+        enqueue=True,
     )
     
-    # File handler if specified
+    # File handler: explicit path or default log file in logs directory.
+    # Errors land here too with extended tracebacks, so no separate error
+    # sink is needed.
     if log_file:
         log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        logger.add(
-            log_path,
-            level=level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            rotation="10 MB",
-            retention="7 days",
-            compression="zip",
-        )
     else:
-        # Default log file in logs directory
-        logs_dir = settings.logs_dir
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        
-        logger.add(
-            logs_dir / "app.log",
-            level=level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            rotation="10 MB",
-            retention="7 days",
-            compression="zip",
-        )
+        log_path = settings.logs_dir / "app.log"
+    _ensure_dir(log_path.parent)
     
-    # Add error log file
-    error_log_path = logs_dir / "errors.log" if not log_file else Path(log_file).parent / "errors.log"
     logger.add(
-        error_log_path,
-        level="ERROR",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        log_path,
+        level=level,
+        format=_FMT_PLAIN,
         rotation="10 MB",
-        retention="30 days",
-        compression="zip",
+        retention="7 days",
+        compression=_compress_in_background,
+        buffering=65536,  # Block-buffered instead of loguru's line buffering
         backtrace=True,
         diagnose=True,
+        enqueue=True,
     )
     
+    _initialized = True
     logger.info(f"Logging initialized with level: {level}")
 
 
-def get_logger(name: str) -> logger:
+def get_logger(name: str) -> "Logger":
     """
     Get a logger instance with the given name.
     
@@ -86,8 +126,7 @@ def get_logger(name: str) -> logger:
     Returns:
         Logger instance
     """
+    from loguru import logger
+    
     return logger.bind(name=name)
 
-
-# Initialize logging on import
-setup_logging()
\ No newline at end of file
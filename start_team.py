@@ -4,9 +4,14 @@ AI开发团队启动脚本 - Python3.11兼容版
 """
 
 import asyncio
+import functools
+import importlib.util
 import subprocess
 import sys
 import json
+import os
+import signal
+import socket
 import time
 from pathlib import Path
 
@@ -17,13 +22,13 @@ def check_dependencies():
     required_modules = ['psycopg2', 'redis', 'fastapi', 'uvicorn']
     missing = []
     
+    # 只查找模块是否存在，不执行导入
     for module in required_modules:
-        try:
-            __import__(module)
-            print(f"✅ {module}")
-        except ImportError:
+        if importlib.util.find_spec(module) is None:
             missing.append(module)
             print(f"❌ {module}")
+        else:
+            print(f"✅ {module}")
     
     if missing:
         print(f"\n⚠️ 缺少依赖: {', '.join(missing)}")
@@ -32,15 +37,33 @@ def check_dependencies():
     
     return True
 
+REQUIRED_CONTAINERS = frozenset({'agent_team_postgres', 'agent_team_redis'})
+
+@functools.lru_cache(maxsize=1)
+def running_containers():
+    """获取运行中的agent_team容器名称"""
+    try:
+        import docker
+    except ImportError:
+        docker = None
+    
+    if docker is not None:
+        # 直接通过Docker socket查询，避免启动docker CLI进程
+        client = docker.from_env()
+        containers = client.containers.list(filters={'name': 'agent_team'})
+        return frozenset(c.name for c in containers)
+    
+    result = subprocess.run(['docker', 'ps', '--filter', 'name=agent_team', '--format', '{{.Names}}'],
+                          capture_output=True, text=True)
+    return frozenset(result.stdout.split())
+
 def check_services():
     """检查服务状态"""
     print("\n🔍 检查服务状态...")
     
     # 检查Docker容器
     try:
-        result = subprocess.run(['docker', 'ps', '--filter', 'name=agent_team'], 
-                              capture_output=True, text=True)
-        if 'agent_team_postgres' in result.stdout and 'agent_team_redis' in result.stdout:
+        if REQUIRED_CONTAINERS.issubset(running_containers()):
             print("✅ 数据库服务运行中")
             return True
         else:
@@ -50,19 +73,30 @@ def check_services():
         print("❌ Docker服务检查失败")
         return False
 
-def start_backend():
+def wait_ready(port, host='127.0.0.1', timeout=10.0):
+    """轮询端口直到服务可连接"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+def load_port_config():
+    """读取端口配置"""
+    try:
+        with open('ports.json', 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def start_backend(config):
     """启动后端服务"""
     print("\n🚀 启动后端API服务...")
     
-    # 读取端口配置
-    backend_port = 8080
-    if Path('ports.json').exists():
-        try:
-            with open('ports.json', 'r') as f:
-                config = json.load(f)
-                backend_port = config.get('backend_port', 8080)
-        except:
-            pass
+    backend_port = config.get('backend_port', 8080)
     
     print(f"📡 API服务将在端口 {backend_port} 启动")
     print(f"📚 访问 http://localhost:{backend_port}/docs 查看API文档")
@@ -74,22 +108,14 @@ def start_backend():
     
     return backend_port
 
-def start_frontend():
+def start_frontend(config, has_frontend):
     """启动前端服务"""
     print("\n🌐 准备前端服务...")
     
-    frontend_port = 3000
-    if Path('ports.json').exists():
-        try:
-            with open('ports.json', 'r') as f:
-                config = json.load(f)
-                frontend_port = config.get('frontend_port', 3000)
-        except:
-            pass
+    frontend_port = config.get('frontend_port', 3000)
     
     # 检查前端文件
-    frontend_dir = Path('frontend')
-    if frontend_dir.exists():
+    if has_frontend:
         print(f"🎯 前端服务将在端口 {frontend_port} 启动")
         print("前端文件已准备就绪")
     else:
@@ -143,29 +169,42 @@ def main():
         try:
             subprocess.run(['docker-compose', 'up', '-d', 'postgres', 'redis'], 
                          check=True)
+            running_containers.cache_clear()
             print("✅ 数据库服务启动成功")
-            time.sleep(3)  # 等待服务完全启动
+            # 等待服务完全启动
+            for name, port in (('PostgreSQL', 5432), ('Redis', 6379)):
+                if not wait_ready(port):
+                    print(f"⚠️ {name} 端口 {port} 尚未就绪")
         except:
             print("❌ 无法启动数据库服务")
             print("请手动运行: docker-compose up -d postgres redis")
             sys.exit(1)
     
+    # 读取端口配置和前端目录
+    port_config = load_port_config()
+    has_frontend = os.path.isdir('frontend')
+    
     # 启动后端
-    backend_port = start_backend()
+    backend_port = start_backend(port_config)
     
     # 启动前端
-    frontend_port = start_frontend()
+    frontend_port = start_frontend(port_config, has_frontend)
     
     # 等待服务启动
-    time.sleep(2)
+    if not wait_ready(backend_port):
+        print(f"⚠️ 后端端口 {backend_port} 尚未就绪")
     
     # 显示启动信息
     print_startup_info(backend_port, frontend_port)
     
     try:
-        # 保持运行
-        while True:
-            time.sleep(1)
+        # 保持运行，直到收到信号
+        if hasattr(signal, 'pause'):
+            signal.pause()
+        else:
+            # Windows没有signal.pause
+            while True:
+                time.sleep(1)
     except KeyboardInterrupt:
         print("\n\n👋 正在停止AI Agent开发团队...")
         print("谢谢使用！")
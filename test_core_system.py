@@ -4,23 +4,43 @@
 import asyncio
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+import pytest
 
-from src.agents.implementations.manager_agent import ManagerAgent
-from src.agents.base import AgentRole, AgentContext
-from src.utils import get_logger
+# Add project root to path unless pytest's rootdir insertion already did
+_ROOT = str(Path(__file__).parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from src.agents.base import AgentContext
+from src.utils import get_logger, setup_logging
+from tests._runner import run, run_tests
+
+# The agent is only built by main() or the conftest fixture, so importing
+# it is deferred until a run actually needs it
+if TYPE_CHECKING:
+    from src.agents.implementations.manager_agent import ManagerAgent
 
 logger = get_logger(__name__)
 
+# Under pytest, run this module's tests on one loop so the shared agent
+# fixture never sees a second event loop
+pytestmark = pytest.mark.asyncio(scope="module")
+
+# Contexts are read-only for the agents, so tests share these instances
+CTX_SPRINT1 = AgentContext(project_id="test-project-001", sprint_id="sprint-001")
+CTX_SPRINT2 = AgentContext(project_id="test-project-001", sprint_id="sprint-002")
+CTX_QUALITY = AgentContext(project_id="test-project", sprint_id="sprint-test")
+CTX_DECISIONS = AgentContext(project_id="test-project", sprint_id="sprint-001")
+
 
-async def test_manager_agent():
+async def test_manager_agent(manager: "ManagerAgent"):
     """Test Manager Agent functionality without external dependencies."""
     
-    print("\n🧪 Testing Manager Agent...")
+    out = []
     
-    manager = ManagerAgent("manager-001")
+    out.append("\n🧪 Testing Manager Agent...")
     
     # Test task assignment
     task = {
@@ -34,20 +54,17 @@ async def test_manager_agent():
         "priority": "high"
     }
     
-    context = AgentContext(
-        project_id="test-project-001",
-        sprint_id="sprint-001"
-    )
+    context = CTX_SPRINT1
     
     result = await manager.process_task(task, context)
     
     if result.get("status") == "success":
-        print("✅ Manager Agent task assignment works")
+        out.append("✅ Manager Agent task assignment works")
         assignment = result.get("assignment", {})
-        print(f"   📋 Task ID: {assignment.get('task_id', 'N/A')}")
-        print(f"   👤 Assigned to: {assignment.get('assigned_to', 'N/A')}")
+        out.append(f"   📋 Task ID: {assignment.get('task_id', 'N/A')}")
+        out.append(f"   👤 Assigned to: {assignment.get('assigned_to', 'N/A')}")
     else:
-        print("❌ Manager Agent task assignment failed")
+        out.append("❌ Manager Agent task assignment failed")
     
     # Test work validation
     validation_task = {
@@ -65,11 +82,11 @@ async def test_manager_agent():
     validation_result = await manager.process_task(validation_task, context)
     
     if validation_result.get("approved"):
-        print("✅ Manager Agent work validation works")
+        out.append("✅ Manager Agent work validation works")
         score = validation_result.get("validation_result", {}).get("score", 0)
-        print(f"   📊 Validation Score: {score:.2f}")
+        out.append(f"   📊 Validation Score: {score:.2f}")
     else:
-        print("❌ Manager Agent work validation failed")
+        out.append("❌ Manager Agent work validation failed")
     
     # Test conflict resolution
     conflict_task = {
@@ -85,19 +102,21 @@ async def test_manager_agent():
     conflict_result = await manager.process_task(conflict_task, context)
     
     if conflict_result.get("status") == "success":
-        print("✅ Manager Agent conflict resolution works")
+        out.append("✅ Manager Agent conflict resolution works")
         resolution = conflict_result.get("conflict_resolution", {})
-        print(f"   ⚖️  Resolution: {resolution.get('resolution', {}).get('decision', 'N/A')}")
+        out.append(f"   ⚖️  Resolution: {resolution.get('resolution', {}).get('decision', 'N/A')}")
     else:
-        print("❌ Manager Agent conflict resolution failed")
+        out.append("❌ Manager Agent conflict resolution failed")
+    
+    return "\n".join(out)
 
 
-async def test_sprint_planning():
+async def test_sprint_planning(manager: "ManagerAgent"):
     """Test sprint planning simulation."""
     
-    print("\n🧪 Testing Sprint Planning...")
+    out = []
     
-    manager = ManagerAgent("manager-001")
+    out.append("\n🧪 Testing Sprint Planning...")
     
     planning_task = {
         "type": "sprint_planning",
@@ -130,76 +149,76 @@ async def test_sprint_planning():
         ]
     }
     
-    context = AgentContext(
-        project_id="test-project-001",
-        sprint_id="sprint-002"
-    )
+    context = CTX_SPRINT2
     
     result = await manager.process_task(planning_task, context)
     
     if result.get("status") == "success":
-        print("✅ Sprint Planning works")
+        out.append("✅ Sprint Planning works")
         
         sprint_plan = result.get("sprint_plan", {})
-        print(f"   🎯 Sprint Goal: {sprint_plan.get('goal', 'N/A')}")
-        print(f"   📊 Total Story Points: {sprint_plan.get('timeline', {}).get('total_story_points', 0)}")
-        print(f"   👥 Team Assignments: {len(sprint_plan.get('assignments', {}))}")
-        print(f"   ⚠️  Identified Risks: {len(sprint_plan.get('risks', []))}")
+        out.append(f"   🎯 Sprint Goal: {sprint_plan.get('goal', 'N/A')}")
+        out.append(f"   📊 Total Story Points: {sprint_plan.get('timeline', {}).get('total_story_points', 0)}")
+        out.append(f"   👥 Team Assignments: {len(sprint_plan.get('assignments', {}))}")
+        out.append(f"   ⚠️  Identified Risks: {len(sprint_plan.get('risks', []))}")
         
         # Show assignments
         assignments = sprint_plan.get('assignments', {})
         for agent_id, stories in assignments.items():
-            print(f"   📝 {agent_id}: {len(stories)} stories")
+            out.append(f"   📝 {agent_id}: {len(stories)} stories")
         
     else:
-        print("❌ Sprint Planning failed")
+        out.append("❌ Sprint Planning failed")
+    
+    return "\n".join(out)
 
 
-async def test_team_coordination():
+async def test_team_coordination(manager: "ManagerAgent"):
     """Test team coordination functionality."""
     
-    print("\n🧪 Testing Team Coordination...")
+    out = []
     
-    manager = ManagerAgent("manager-001")
+    out.append("\n🧪 Testing Team Coordination...")
     
     coordination_task = {
         "type": "coordinate",
         "coordination_type": "daily_standup"
     }
     
-    context = AgentContext(
-        project_id="test-project-001",
-        sprint_id="sprint-001"
-    )
+    context = CTX_SPRINT1
     
     result = await manager.process_task(coordination_task, context)
     
     if result.get("status") == "success":
-        print("✅ Team Coordination works")
+        out.append("✅ Team Coordination works")
         
         coordination_result = result.get("coordination_result", {})
         agent_statuses = coordination_result.get("agent_statuses", {})
         blockers = coordination_result.get("blockers", [])
         priorities = coordination_result.get("priorities", [])
         
-        print(f"   👥 Agents Checked: {len(agent_statuses)}")
-        print(f"   🚫 Blockers Found: {len(blockers)}")
-        print(f"   📋 Priorities Set: {len(priorities)}")
+        out.append(f"   👥 Agents Checked: {len(agent_statuses)}")
+        out.append(f"   🚫 Blockers Found: {len(blockers)}")
+        out.append(f"   📋 Priorities Set: {len(priorities)}")
         
         # Show agent statuses
-        for agent_id, status in agent_statuses.items():
-            print(f"   📊 {agent_id}: {status.get('status', 'unknown')} ({status.get('progress', 0):.0%} complete)")
+        out.extend(
+            f"   📊 {agent_id}: {status.get('status', 'unknown')} ({status.get('progress', 0):.0%} complete)"
+            for agent_id, status in agent_statuses.items()
+        )
         
     else:
-        print("❌ Team Coordination failed")
+        out.append("❌ Team Coordination failed")
+    
+    return "\n".join(out)
 
 
-async def test_quality_standards():
+async def test_quality_standards(manager: "ManagerAgent"):
     """Test quality validation standards."""
     
-    print("\n🧪 Testing Quality Standards...")
+    out = []
     
-    manager = ManagerAgent("manager-001")
+    out.append("\n🧪 Testing Quality Standards...")
     
     # Test different agent outputs
     test_cases = [
@@ -236,45 +255,57 @@ async def test_quality_standards():
         }
     ]
     
-    passed_tests = 0
+    context = CTX_QUALITY
     
-    for i, test_case in enumerate(test_cases):
-        validation_task = {
+    # Validate all cases concurrently
+    results = await asyncio.gather(*[
+        manager.process_task({
             "type": "validate",
             "agent_id": f"test-agent-{i}",
             "agent_role": test_case["agent_role"],
             "output": test_case["output"]
-        }
-        
-        context = AgentContext(project_id="test-project", sprint_id="sprint-test")
-        result = await manager.process_task(validation_task, context)
-        
-        is_approved = result.get("approved", False)
-        if is_approved == test_case["expected"]:
-            passed_tests += 1
-            print(f"   ✅ {test_case['agent_role']} validation: {'PASS' if is_approved else 'FAIL'} (expected)")
-        else:
-            print(f"   ❌ {test_case['agent_role']} validation: {'PASS' if is_approved else 'FAIL'} (unexpected)")
+        }, context)
+        for i, test_case in enumerate(test_cases)
+    ])
+    
+    approvals = [result.get("approved", False) for result in results]
+    matches = [
+        approved == test_case["expected"]
+        for approved, test_case in zip(approvals, test_cases)
+    ]
+    passed_tests = sum(matches)
+    out.extend(
+        f"   {'✅' if match else '❌'} {test_case['agent_role']} validation: "
+        f"{'PASS' if approved else 'FAIL'} ({'expected' if match else 'unexpected'})"
+        for test_case, approved, match in zip(test_cases, approvals, matches)
+    )
     
     if passed_tests == len(test_cases):
-        print("✅ Quality Standards work correctly")
+        out.append("✅ Quality Standards work correctly")
     else:
-        print(f"❌ Quality Standards partially failed ({passed_tests}/{len(test_cases)} tests passed)")
+        out.append(f"❌ Quality Standards partially failed ({passed_tests}/{len(test_cases)} tests passed)")
+    
+    return "\n".join(out)
 
 
 async def test_decision_tracking():
     """Test decision tracking in manager."""
     
-    print("\n🧪 Testing Decision Tracking...")
+    out = []
     
-    manager = ManagerAgent("manager-001")
+    # The other tests add conflicts and tasks to the shared agent while this
+    # one runs, so count the histories on an agent of its own
+    from src.agents.implementations.manager_agent import ManagerAgent
+    manager = ManagerAgent("manager-decisions")
+    
+    out.append("\n🧪 Testing Decision Tracking...")
     
     # Check initial state
     initial_conflicts = len(manager.get_conflict_history())
     initial_tasks = len(manager.get_active_tasks())
     
     # Create some conflicts and tasks
-    context = AgentContext(project_id="test-project", sprint_id="sprint-001")
+    context = CTX_DECISIONS
     
     # Add a conflict
     conflict_task = {
@@ -287,8 +318,6 @@ async def test_decision_tracking():
         }
     }
     
-    await manager.process_task(conflict_task, context)
-    
     # Add a task
     task_assignment = {
         "type": "assign_task",
@@ -299,33 +328,49 @@ async def test_decision_tracking():
         }
     }
     
-    await manager.process_task(task_assignment, context)
+    # The conflict and the assignment land in separate histories
+    await asyncio.gather(
+        manager.process_task(conflict_task, context),
+        manager.process_task(task_assignment, context),
+    )
     
     # Check final state
     final_conflicts = len(manager.get_conflict_history())
     final_tasks = len(manager.get_active_tasks())
     
     if final_conflicts > initial_conflicts and final_tasks > initial_tasks:
-        print("✅ Decision Tracking works")
-        print(f"   📊 Conflicts tracked: {final_conflicts}")
-        print(f"   📋 Tasks tracked: {final_tasks}")
+        out.append("✅ Decision Tracking works")
+        out.append(f"   📊 Conflicts tracked: {final_conflicts}")
+        out.append(f"   📋 Tasks tracked: {final_tasks}")
     else:
-        print("❌ Decision Tracking failed")
+        out.append("❌ Decision Tracking failed")
+    
+    return "\n".join(out)
 
 
-async def main():
-    """Run all core system tests."""
+async def main() -> bool:
+    """Run all core system tests and return whether every report passed."""
+    
+    # Agent INFO logs are noise here; the report is printed separately
+    setup_logging(log_level="WARNING")
     
     print("🚀 AI Agent Team - Core System Test")
     print("=" * 50)
     print("Testing core functionality without external dependencies...")
     
-    # Run tests
-    await test_manager_agent()
-    await test_sprint_planning()
-    await test_team_coordination()
-    await test_quality_standards()
-    await test_decision_tracking()
+    # One agent shared by all tests
+    from src.agents.implementations.manager_agent import ManagerAgent
+    manager = ManagerAgent("manager-001")
+    
+    # Run independent tests concurrently, then print their output in order
+    reports = await run_tests(
+        test_manager_agent(manager),
+        test_sprint_planning(manager),
+        test_team_coordination(manager),
+        test_quality_standards(manager),
+        test_decision_tracking(),
+    )
+    sys.stdout.write("\n".join(reports) + "\n")
     
     print("\n" + "=" * 50)
     print("🎉 Core system tests completed!")
@@ -345,7 +390,10 @@ async def main():
     print("5. Create project import interface")
     
     print("\n💡 The core architecture is solid and ready for extension!")
+    
+    # The tests report failures as ❌ lines rather than raising
+    return not any("❌" in report for report in reports)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    sys.exit(0 if run(main()) else 1)
@@ -6,147 +6,43 @@ import sys
 import tempfile
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+import pytest
+
+# Add project root to path unless pytest's rootdir insertion already did
+_ROOT = str(Path(__file__).parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
-from src.agents.implementations.developer_agent import DeveloperAgent
 from src.agents.base import AgentContext
-from src.utils import get_logger
+from src.utils import get_logger, setup_logging
+from tests._runner import run, run_tests
 
-logger = get_logger(__name__)
+# The agent is only built by main() or the conftest fixture, so importing
+# it is deferred until a run actually needs it
+if TYPE_CHECKING:
+    from src.agents.implementations.developer_agent import DeveloperAgent
 
+logger = get_logger(__name__)
 
-async def test_feature_implementation():
-    """Test feature implementation with MCP capabilities."""
-    
-    print("\n🛠️ Testing Feature Implementation...")
-    
-    developer = DeveloperAgent("dev-001")
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
-        feature_task = {
-            "type": "implement_feature",
-            "feature_specification": {
-                "name": "user_authentication",
-                "description": "Implement user login and registration functionality",
-                "requirements": [
-                    "User can register with email and password",
-                    "User can login with credentials",
-                    "Password validation and hashing",
-                    "Session management"
-                ]
-            },
-            "project_path": temp_dir,
-            "language": "python",
-            "include_tests": True,
-            "run_tests": False,  # Skip test execution in demo
-            "auto_commit": False  # Skip git operations in demo
-        }
-        
-        context = AgentContext(
-            project_id="test-dev-feature-001",
-            sprint_id="dev-sprint-001"
-        )
-        
-        result = await developer.process_task(feature_task, context)
-        
-        if result.get("status") == "success":
-            print("✅ Feature Implementation works")
-            
-            implementation = result.get("implementation", {})
-            
-            print(f"   📁 Feature: {implementation.get('feature_name', 'N/A')}")
-            print(f"   📄 Generated Files: {len(implementation.get('generated_files', []))}")
-            print(f"   🧪 Test Files: {len(implementation.get('test_files', []))}")
-            
-            # Show generated files
-            for file_path in implementation.get("generated_files", [])[:3]:
-                if isinstance(file_path, str):
-                    print(f"   📝 Created: {os.path.basename(file_path)}")
-                else:
-                    print(f"   📝 Created: {file_path.get('path', 'Unknown')}")
-            
-            # Check code quality
-            quality = implementation.get("code_quality", {})
-            print(f"   📊 Code Quality Score: {quality.get('overall_score', 'N/A')}")
-            
-        else:
-            print("❌ Feature Implementation failed")
-            print(f"   Error: {result.get('message', 'Unknown error')}")
+# Under pytest, run this module's tests on one loop so the shared agent
+# fixture never sees a second event loop
+pytestmark = pytest.mark.asyncio(scope="module")
 
+# Contexts are read-only for the agent, so tests share these instances
+CTX_DEV_FEATURE = AgentContext(project_id="test-dev-feature-001", sprint_id="dev-sprint-001")
+CTX_DEV_BUG = AgentContext(project_id="test-dev-bug-001", sprint_id="dev-sprint-001")
+CTX_DEV_TESTS = AgentContext(project_id="test-dev-tests-001", sprint_id="dev-sprint-001")
+CTX_DEV_SETUP = AgentContext(project_id="test-dev-setup-001", sprint_id="dev-sprint-001")
 
-async def test_bug_fixing():
-    """Test bug fixing capabilities."""
-    
-    print("\n🐛 Testing Bug Fixing...")
-    
-    developer = DeveloperAgent("dev-001")
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a sample file with a "bug"
-        buggy_file = os.path.join(temp_dir, "buggy_code.py")
-        with open(buggy_file, 'w') as f:
-            f.write("""
+# Fixture sources written into the scratch project; encoded once at import
+_BUGGY_SRC = b"""
 def calculate_average(numbers):
     return sum(numbers) / len(numbers)  # Bug: doesn't handle empty list
-""")
-        
-        bug_task = {
-            "type": "fix_bug",
-            "bug_report": {
-                "title": "Division by zero in calculate_average",
-                "description": "Function crashes when empty list is passed",
-                "severity": "high",
-                "steps_to_reproduce": [
-                    "Call calculate_average([])",
-                    "ZeroDivisionError is raised"
-                ],
-                "expected_behavior": "Should handle empty list gracefully"
-            },
-            "project_path": temp_dir,
-            "language": "python",
-            "auto_commit": False
-        }
-        
-        context = AgentContext(
-            project_id="test-dev-bug-001",
-            sprint_id="dev-sprint-001"
-        )
-        
-        result = await developer.process_task(bug_task, context)
-        
-        if result.get("status") == "success":
-            print("✅ Bug Fixing works")
-            
-            bug_fix = result.get("bug_fix", {})
-            
-            print(f"   🐛 Bug: {bug_fix.get('bug_title', 'N/A')}")
-            print(f"   🔍 Root Cause: {bug_fix.get('root_cause', {}).get('root_cause', 'N/A')}")
-            print(f"   🔧 Fixed Files: {len(bug_fix.get('fixed_files', []))}")
-            print(f"   🧪 Regression Tests: {len(bug_fix.get('regression_tests', []))}")
-            
-            # Show fix verification
-            verification = bug_fix.get("verification", {})
-            print(f"   ✅ Fix Verified: {verification.get('fixed', 'Unknown')}")
-            
-        else:
-            print("❌ Bug Fixing failed")
-            print(f"   Error: {result.get('message', 'Unknown error')}")
+"""
 
-
-async def test_test_writing():
-    """Test comprehensive test writing."""
-    
-    print("\n🧪 Testing Test Writing...")
-    
-    developer = DeveloperAgent("dev-001")
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create sample code files
-        code_file = os.path.join(temp_dir, "math_utils.py")
-        with open(code_file, 'w') as f:
-            f.write("""
+_MATH_UTILS_SRC = b"""
 def add(a, b):
     return a + b
 
@@ -167,163 +63,306 @@ class Calculator:
         
         self.history.append((operation, a, b, result))
         return result
-""")
+"""
+
+# Static task specifications; the agent only reads them
+_FEATURE_SPEC = {
+    "name": "user_authentication",
+    "description": "Implement user login and registration functionality",
+    "requirements": [
+        "User can register with email and password",
+        "User can login with credentials",
+        "Password validation and hashing",
+        "Session management"
+    ]
+}
+
+_BUG_REPORT = {
+    "title": "Division by zero in calculate_average",
+    "description": "Function crashes when empty list is passed",
+    "severity": "high",
+    "steps_to_reproduce": [
+        "Call calculate_average([])",
+        "ZeroDivisionError is raised"
+    ],
+    "expected_behavior": "Should handle empty list gracefully"
+}
+
+_PROJECT_CONFIG = {
+    "name": "ai_assistant_api",
+    "description": "RESTful API for AI assistant functionality",
+    "type": "web_api",
+    "features": ["authentication", "chat", "file_upload"]
+}
+
+
+async def test_feature_implementation(developer: "DeveloperAgent", temp_dir: str):
+    """Test feature implementation with MCP capabilities."""
+    
+    out = []
+    
+    out.append("\n🛠️ Testing Feature Implementation...")
+    
+    os.makedirs(temp_dir, exist_ok=True)
+    
+    feature_task = {
+        "type": "implement_feature",
+        "feature_specification": _FEATURE_SPEC,
+        "project_path": temp_dir,
+        "language": "python",
+        "include_tests": True,
+        "run_tests": False,  # Skip test execution in demo
+        "auto_commit": False  # Skip git operations in demo
+    }
+    
+    context = CTX_DEV_FEATURE
+    
+    result = await developer.process_task(feature_task, context)
+    
+    if result.get("status") == "success":
+        out.append("✅ Feature Implementation works")
         
-        test_task = {
-            "type": "write_tests",
-            "code_files": ["math_utils.py"],
-            "project_path": temp_dir,
-            "language": "python",
-            "framework": "pytest"
-        }
+        implementation = result.get("implementation", {})
         
-        context = AgentContext(
-            project_id="test-dev-tests-001",
-            sprint_id="dev-sprint-001"
-        )
+        out.append(f"   📁 Feature: {implementation.get('feature_name', 'N/A')}")
+        out.append(f"   📄 Generated Files: {len(implementation.get('generated_files', []))}")
+        out.append(f"   🧪 Test Files: {len(implementation.get('test_files', []))}")
+        
+        # Show generated files
+        for file_path in implementation.get("generated_files", [])[:3]:
+            if isinstance(file_path, str):
+                out.append(f"   📝 Created: {os.path.basename(file_path)}")
+            else:
+                out.append(f"   📝 Created: {file_path.get('path', 'Unknown')}")
         
-        result = await developer.process_task(test_task, context)
+        # Check code quality
+        quality = implementation.get("code_quality", {})
+        out.append(f"   📊 Code Quality Score: {quality.get('overall_score', 'N/A')}")
         
-        if result.get("status") == "success":
-            print("✅ Test Writing works")
-            
-            test_writing = result.get("test_writing", {})
-            
-            print(f"   📊 Total Test Cases: {test_writing.get('total_test_cases', 0)}")
-            print(f"   📄 Test Files Created: {len(test_writing.get('test_files_created', []))}")
-            
-            # Show test files created
-            for test_file in test_writing.get("test_files_created", [])[:3]:
-                source = test_file.get("source_file", "Unknown")
-                test_path = test_file.get("test_file", "Unknown")
-                cases = test_file.get("test_cases_count", 0)
-                print(f"   🧪 {source} → {test_path} ({cases} test cases)")
-            
-            # Show coverage if available
-            coverage = test_writing.get("coverage_report", {})
-            if coverage:
-                overall = coverage.get("overall_coverage", 0)
-                print(f"   📈 Test Coverage: {overall}%")
-            
-        else:
-            print("❌ Test Writing failed")
-            print(f"   Error: {result.get('message', 'Unknown error')}")
+    else:
+        out.append("❌ Feature Implementation failed")
+        out.append(f"   Error: {result.get('message', 'Unknown error')}")
+    
+    return "\n".join(out)
 
 
-async def test_project_setup():
-    """Test new project setup."""
+async def test_bug_fixing(developer: "DeveloperAgent", temp_dir: str):
+    """Test bug fixing capabilities."""
     
-    print("\n🏗️ Testing Project Setup...")
+    out = []
     
-    developer = DeveloperAgent("dev-001")
+    out.append("\n🐛 Testing Bug Fixing...")
+    
+    os.makedirs(temp_dir, exist_ok=True)
+    
+    # Create a sample file with a "bug"
+    buggy_file = os.path.join(temp_dir, "buggy_code.py")
+    await asyncio.to_thread(Path(buggy_file).write_bytes, _BUGGY_SRC)
+    
+    bug_task = {
+        "type": "fix_bug",
+        "bug_report": _BUG_REPORT,
+        "project_path": temp_dir,
+        "language": "python",
+        "auto_commit": False
+    }
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        project_path = os.path.join(temp_dir, "new_project")
+    context = CTX_DEV_BUG
+    
+    result = await developer.process_task(bug_task, context)
+    
+    if result.get("status") == "success":
+        out.append("✅ Bug Fixing works")
         
-        setup_task = {
-            "type": "setup_project",
-            "project_config": {
-                "name": "ai_assistant_api",
-                "description": "RESTful API for AI assistant functionality",
-                "type": "web_api",
-                "features": ["authentication", "chat", "file_upload"]
-            },
-            "project_path": project_path,
-            "language": "python",
-            "init_git": False,  # Skip git in demo
-            "install_deps": False,  # Skip dependency installation
-            "run_initial_tests": False  # Skip test execution
-        }
+        bug_fix = result.get("bug_fix", {})
         
-        context = AgentContext(
-            project_id="test-dev-setup-001",
-            sprint_id="dev-sprint-001"
-        )
+        out.append(f"   🐛 Bug: {bug_fix.get('bug_title', 'N/A')}")
+        out.append(f"   🔍 Root Cause: {bug_fix.get('root_cause', {}).get('root_cause', 'N/A')}")
+        out.append(f"   🔧 Fixed Files: {len(bug_fix.get('fixed_files', []))}")
+        out.append(f"   🧪 Regression Tests: {len(bug_fix.get('regression_tests', []))}")
         
-        result = await developer.process_task(setup_task, context)
+        # Show fix verification
+        verification = bug_fix.get("verification", {})
+        out.append(f"   ✅ Fix Verified: {verification.get('fixed', 'Unknown')}")
         
-        if result.get("status") == "success":
-            print("✅ Project Setup works")
-            
-            setup = result.get("project_setup", {})
-            
-            print(f"   📁 Project Path: {os.path.basename(setup.get('project_path', 'N/A'))}")
-            print(f"   💻 Language: {setup.get('language', 'N/A')}")
-            print(f"   📂 Directories Created: {len(setup.get('directories_created', []))}")
-            print(f"   📄 Files Created: {len(setup.get('files_created', []))}")
-            
-            # Show created files
-            for file_path in setup.get("files_created", [])[:5]:
-                print(f"   📝 {file_path}")
-            
-            # Show next steps
-            next_steps = setup.get("next_steps", [])
-            if next_steps:
-                print(f"   📋 Next Steps: {len(next_steps)} recommendations")
-            
-        else:
-            print("❌ Project Setup failed")
-            print(f"   Error: {result.get('message', 'Unknown error')}")
+    else:
+        out.append("❌ Bug Fixing failed")
+        out.append(f"   Error: {result.get('message', 'Unknown error')}")
+    
+    return "\n".join(out)
 
 
-async def test_mcp_capabilities():
-    """Test MCP (Model Context Protocol) capabilities."""
+async def test_test_writing(developer: "DeveloperAgent", temp_dir: str):
+    """Test comprehensive test writing."""
     
-    print("\n🔧 Testing MCP Capabilities...")
+    out = []
     
-    developer = DeveloperAgent("dev-001")
+    out.append("\n🧪 Testing Test Writing...")
+    
+    os.makedirs(temp_dir, exist_ok=True)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Test filesystem operations
-        test_file = os.path.join(temp_dir, "test_file.py")
-        test_content = "# Test file for MCP capabilities\nprint('Hello, MCP!')"
+    # Create sample code files
+    code_file = os.path.join(temp_dir, "math_utils.py")
+    await asyncio.to_thread(Path(code_file).write_bytes, _MATH_UTILS_SRC)
+    
+    test_task = {
+        "type": "write_tests",
+        "code_files": ["math_utils.py"],
+        "project_path": temp_dir,
+        "language": "python",
+        "framework": "pytest"
+    }
+    
+    context = CTX_DEV_TESTS
+    
+    result = await developer.process_task(test_task, context)
+    
+    if result.get("status") == "success":
+        out.append("✅ Test Writing works")
         
-        # Test file writing
-        write_result = await developer._write_file_mcp(test_file, test_content)
+        test_writing = result.get("test_writing", {})
         
-        if write_result.get("success"):
-            print("✅ MCP File Writing works")
-            print(f"   📝 File written: {os.path.basename(write_result.get('file_path', 'N/A'))}")
-        else:
-            print("❌ MCP File Writing failed")
+        out.append(f"   📊 Total Test Cases: {test_writing.get('total_test_cases', 0)}")
+        out.append(f"   📄 Test Files Created: {len(test_writing.get('test_files_created', []))}")
         
-        # Test file reading
-        if write_result.get("success"):
-            read_content = await developer._read_file_mcp(test_file)
-            
-            if read_content == test_content:
-                print("✅ MCP File Reading works")
-                print(f"   📖 Content matches: {len(read_content)} characters")
-            else:
-                print("❌ MCP File Reading failed")
+        # Show test files created
+        for test_file in test_writing.get("test_files_created", [])[:3]:
+            source = test_file.get("source_file", "Unknown")
+            test_path = test_file.get("test_file", "Unknown")
+            cases = test_file.get("test_cases_count", 0)
+            out.append(f"   🧪 {source} → {test_path} ({cases} test cases)")
         
-        # Test directory creation
-        test_dir = os.path.join(temp_dir, "test_directory")
-        dir_result = await developer._create_directory_mcp(test_dir)
+        # Show coverage if available
+        coverage = test_writing.get("coverage_report", {})
+        if coverage:
+            overall = coverage.get("overall_coverage", 0)
+            out.append(f"   📈 Test Coverage: {overall}%")
         
-        if dir_result.get("success"):
-            print("✅ MCP Directory Creation works")
-            print(f"   📁 Directory created: {os.path.basename(dir_result.get('directory', 'N/A'))}")
-        else:
-            print("❌ MCP Directory Creation failed")
+    else:
+        out.append("❌ Test Writing failed")
+        out.append(f"   Error: {result.get('message', 'Unknown error')}")
+    
+    return "\n".join(out)
+
+
+async def test_project_setup(developer: "DeveloperAgent", temp_dir: str):
+    """Test new project setup."""
+    
+    out = []
+    
+    out.append("\n🏗️ Testing Project Setup...")
+    
+    os.makedirs(temp_dir, exist_ok=True)
+    
+    project_path = os.path.join(temp_dir, "new_project")
+    
+    setup_task = {
+        "type": "setup_project",
+        "project_config": _PROJECT_CONFIG,
+        "project_path": project_path,
+        "language": "python",
+        "init_git": False,  # Skip git in demo
+        "install_deps": False,  # Skip dependency installation
+        "run_initial_tests": False  # Skip test execution
+    }
+    
+    context = CTX_DEV_SETUP
+    
+    result = await developer.process_task(setup_task, context)
+    
+    if result.get("status") == "success":
+        out.append("✅ Project Setup works")
+        
+        setup = result.get("project_setup", {})
+        
+        out.append(f"   📁 Project Path: {os.path.basename(setup.get('project_path', 'N/A'))}")
+        out.append(f"   💻 Language: {setup.get('language', 'N/A')}")
+        out.append(f"   📂 Directories Created: {len(setup.get('directories_created', []))}")
+        out.append(f"   📄 Files Created: {len(setup.get('files_created', []))}")
+        
+        # Show created files
+        for file_path in setup.get("files_created", [])[:5]:
+            out.append(f"   📝 {file_path}")
         
-        # Test shell command (simple echo)
-        shell_result = await developer._run_shell_command_mcp("echo 'MCP Shell Test'")
+        # Show next steps
+        next_steps = setup.get("next_steps", [])
+        if next_steps:
+            out.append(f"   📋 Next Steps: {len(next_steps)} recommendations")
         
-        if shell_result.get("success"):
-            print("✅ MCP Shell Command works")
-            output = shell_result.get("stdout", "").strip()
-            print(f"   💻 Shell output: '{output}'")
+    else:
+        out.append("❌ Project Setup failed")
+        out.append(f"   Error: {result.get('message', 'Unknown error')}")
+    
+    return "\n".join(out)
+
+
+async def test_mcp_capabilities(developer: "DeveloperAgent", temp_dir: str):
+    """Test MCP (Model Context Protocol) capabilities."""
+    
+    out = []
+    
+    out.append("\n🔧 Testing MCP Capabilities...")
+    
+    os.makedirs(temp_dir, exist_ok=True)
+    
+    # Test filesystem operations
+    test_file = os.path.join(temp_dir, "test_file.py")
+    test_content = "# Test file for MCP capabilities\nprint('Hello, MCP!')"
+    
+    # Test file writing
+    write_result = await developer._write_file_mcp(test_file, test_content)
+    
+    if write_result.get("success"):
+        out.append("✅ MCP File Writing works")
+        out.append(f"   📝 File written: {os.path.basename(write_result.get('file_path', 'N/A'))}")
+    else:
+        out.append("❌ MCP File Writing failed")
+    
+    # Only the read depends on the write; directory creation and the
+    # shell echo are independent, so run them together
+    test_dir = os.path.join(temp_dir, "test_directory")
+    operations = [
+        developer._create_directory_mcp(test_dir),
+        developer._run_shell_command_mcp("echo 'MCP Shell Test'"),
+    ]
+    if write_result.get("success"):
+        operations.append(developer._read_file_mcp(test_file))
+    dir_result, shell_result, *read_results = await asyncio.gather(*operations)
+    
+    # Test file reading
+    if read_results:
+        read_content = read_results[0]
+        
+        if read_content == test_content:
+            out.append("✅ MCP File Reading works")
+            out.append(f"   📖 Content matches: {len(read_content)} characters")
         else:
-            print("❌ MCP Shell Command failed")
+            out.append("❌ MCP File Reading failed")
+    
+    # Test directory creation
+    if dir_result.get("success"):
+        out.append("✅ MCP Directory Creation works")
+        out.append(f"   📁 Directory created: {os.path.basename(dir_result.get('directory', 'N/A'))}")
+    else:
+        out.append("❌ MCP Directory Creation failed")
+    
+    # Test shell command (simple echo)
+    if shell_result.get("success"):
+        out.append("✅ MCP Shell Command works")
+        output = shell_result.get("stdout", "").strip()
+        out.append(f"   💻 Shell output: '{output}'")
+    else:
+        out.append("❌ MCP Shell Command failed")
+    
+    return "\n".join(out)
 
 
-async def test_code_quality_assessment():
+async def test_code_quality_assessment(developer: "DeveloperAgent"):
     """Test code quality assessment."""
     
-    print("\n📊 Testing Code Quality Assessment...")
+    out = []
     
-    developer = DeveloperAgent("dev-001")
+    out.append("\n📊 Testing Code Quality Assessment...")
     
     # Test with sample generated files
     sample_files = [
@@ -335,29 +374,31 @@ async def test_code_quality_assessment():
     quality = await developer._assess_code_quality(sample_files, "python")
     
     if quality:
-        print("✅ Code Quality Assessment works")
+        out.append("✅ Code Quality Assessment works")
         
-        print(f"   📈 Overall Score: {quality.get('overall_score', 'N/A')}/10")
+        out.append(f"   📈 Overall Score: {quality.get('overall_score', 'N/A')}/10")
         
         metrics = quality.get("metrics", {})
         for metric, value in metrics.items():
-            print(f"   📊 {metric.title()}: {value}")
+            out.append(f"   📊 {metric.title()}: {value}")
         
         suggestions = quality.get("suggestions", [])
         if suggestions:
-            print(f"   💡 Suggestions: {len(suggestions)} recommendations")
+            out.append(f"   💡 Suggestions: {len(suggestions)} recommendations")
             for suggestion in suggestions[:2]:
-                print(f"      • {suggestion}")
+                out.append(f"      • {suggestion}")
     else:
-        print("❌ Code Quality Assessment failed")
+        out.append("❌ Code Quality Assessment failed")
+    
+    return "\n".join(out)
 
 
-async def test_output_validation():
+async def test_output_validation(developer: "DeveloperAgent"):
     """Test developer output validation."""
     
-    print("\n✅ Testing Output Validation...")
+    out = []
     
-    developer = DeveloperAgent("dev-001")
+    out.append("\n✅ Testing Output Validation...")
     
     # Test valid outputs
     valid_outputs = [
@@ -389,43 +430,58 @@ async def test_output_validation():
         {"status": "success", "bug_fix": {}}  # Missing required fields
     ]
     
-    valid_count = 0
-    for output in valid_outputs:
-        if await developer.validate_output(output):
-            valid_count += 1
-    
-    invalid_count = 0
-    for output in invalid_outputs:
-        if not await developer.validate_output(output):
-            invalid_count += 1
+    # One flat gather; the first len(valid_outputs) results are the valid cases
+    results = await asyncio.gather(
+        *[developer.validate_output(output) for output in valid_outputs + invalid_outputs]
+    )
+    split = len(valid_outputs)
+    valid_count = sum(results[:split])
+    invalid_count = sum(not result for result in results[split:])
     
     total_tests = len(valid_outputs) + len(invalid_outputs)
     passed_tests = valid_count + invalid_count
     
     if passed_tests == total_tests:
-        print("✅ Output Validation works correctly")
-        print(f"   ✓ Valid outputs accepted: {valid_count}/{len(valid_outputs)}")
-        print(f"   ✓ Invalid outputs rejected: {invalid_count}/{len(invalid_outputs)}")
+        out.append("✅ Output Validation works correctly")
+        out.append(f"   ✓ Valid outputs accepted: {valid_count}/{len(valid_outputs)}")
+        out.append(f"   ✓ Invalid outputs rejected: {invalid_count}/{len(invalid_outputs)}")
     else:
-        print("❌ Output Validation has issues")
-        print(f"   Tests passed: {passed_tests}/{total_tests}")
+        out.append("❌ Output Validation has issues")
+        out.append(f"   Tests passed: {passed_tests}/{total_tests}")
+    
+    return "\n".join(out)
 
 
-async def main():
-    """Run all Developer Agent tests."""
+async def main() -> bool:
+    """Run all Developer Agent tests and return whether every report passed."""
+    
+    # Agent INFO logs are noise here; the report is printed separately
+    setup_logging(log_level="WARNING")
     
     print("🛠️ AI Agent Team - Developer Agent Test")
     print("=" * 50)
     print("Testing Developer Agent with MCP capabilities...")
     
-    # Run tests
-    await test_feature_implementation()
-    await test_bug_fixing()
-    await test_test_writing()
-    await test_project_setup()
-    await test_mcp_capabilities()
-    await test_code_quality_assessment()
-    await test_output_validation()
+    # One agent shared by all tests
+    from src.agents.implementations.developer_agent import DeveloperAgent
+    developer = DeveloperAgent("dev-001")
+    
+    # Run independent tests concurrently in subdirectories of one scratch
+    # directory (RAM-backed /dev/shm when available), then print in order
+    scratch_parent = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(dir=scratch_parent) as scratch_root:
+        # Bound the fan-out so small CI boxes are not flooded with disk work
+        reports = await run_tests(
+            test_feature_implementation(developer, os.path.join(scratch_root, "feature")),
+            test_bug_fixing(developer, os.path.join(scratch_root, "bug")),
+            test_test_writing(developer, os.path.join(scratch_root, "tests")),
+            test_project_setup(developer, os.path.join(scratch_root, "setup")),
+            test_mcp_capabilities(developer, os.path.join(scratch_root, "mcp")),
+            test_code_quality_assessment(developer),
+            test_output_validation(developer),
+            limit=os.cpu_count() or 1,
+        )
+    sys.stdout.write("\n".join(reports) + "\n")
     
     print("\n" + "=" * 50)
     print("🎉 Developer Agent tests completed!")
@@ -441,7 +497,10 @@ async def main():
     
     print("\n🚀 Developer Agent is ready for integration!")
     print("💡 Next: Integrate with Manager Agent and add to team workflow")
+    
+    # The tests report failures as ❌ lines rather than raising
+    return not any("❌" in report for report in reports)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    sys.exit(0 if run(main()) else 1)
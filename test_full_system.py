@@ -2,47 +2,129 @@
 """Complete system test for AI Agent Team."""
 
 import asyncio
+import functools
 import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+from collections import deque
+from types import MappingProxyType
+from typing import Optional
 
 from src.agents.implementations.manager_agent import ManagerAgent
 from src.core.memory import SprintMemoryManager
 from src.core.project_manager import ProjectManager, ProjectConfig, ProjectPriority
 from src.core.communication import MessageBus, MessageHandler, MessageProtocol, MessageType
-from src.agents.base import AgentRole, AgentContext
-from src.utils import get_logger
+from src.agents.base import AgentRole
+from src.utils import get_logger, setup_logging
+from tests._context import ctx_for
+from tests._footer import NEXT_STEPS
+from tests._runner import run, run_tests
 
 logger = get_logger(__name__)
 
+# Sprint planning payload for the full workflow, built once at import. The
+# manager only reads it, so a read-only view with a story tuple is reused.
+_PLANNING_TASK = MappingProxyType({
+    "type": "sprint_planning",
+    "sprint_goal": "Implement secure login and account overview",
+    "user_stories": (
+        {
+            "id": "US-001",
+            "title": "User Login with 2FA",
+            "description": "As a user, I want to login securely with 2FA",
+            "points": 8,
+            "priority": "high"
+        },
+        {
+            "id": "US-002",
+            "title": "Account Balance Display",
+            "description": "As a user, I want to see my account balance",
+            "points": 5,
+            "priority": "medium"
+        }
+    )
+})
+
 
 class TestMessageHandler(MessageHandler):
     """Test message handler for demonstration."""
     
+    # Acknowledgment payload shared by every reply; the bus copies it when
+    # serializing, so it is never mutated
+    _ACCEPTED_PAYLOAD = {"status": "task_accepted", "eta": "2 days"}
+    
     def __init__(self, agent_id: str):
         super().__init__(agent_id, [MessageType.TASK_ASSIGNMENT, MessageType.STATUS_UPDATE])
-        self.received_messages = []
+        # Bounded so a long-running handler does not grow without limit
+        self.received_messages = deque(maxlen=256)
     
     async def handle_task_assignment(self, message):
         self.received_messages.append(message)
-        logger.info(f"{self.agent_id} received task: {message.payload.get('task', {}).get('title', 'Untitled')}")
+        # Formatted by loguru only if a sink accepts INFO records
+        logger.info(
+            "{} received task: {}",
+            self.agent_id,
+            message.payload.get("task", {}).get("title", "Untitled"),
+        )
         
         # Create acknowledgment
         return message.create_reply(
             from_agent=self.agent_id,
             message_type=MessageType.STATUS_UPDATE,
-            payload={"status": "task_accepted", "eta": "2 days"}
+            payload=self._ACCEPTED_PAYLOAD
         )
 
 
+@functools.lru_cache(maxsize=None)
+def get_manager(agent_id: str) -> ManagerAgent:
+    """Shared Manager Agent per id, reused across tests."""
+    return ManagerAgent(agent_id)
+
+
+@functools.lru_cache(maxsize=1)
+def get_memory_manager() -> SprintMemoryManager:
+    """Shared Sprint Memory Manager reused across tests."""
+    return SprintMemoryManager()
+
+
+@functools.lru_cache(maxsize=1)
+def get_project_manager() -> ProjectManager:
+    """Shared Project Manager backed by the shared memory manager."""
+    return ProjectManager(get_memory_manager())
+
+
+# Initialized once on first use and shut down at the end of main()
+_message_bus: Optional[MessageBus] = None
+_message_bus_lock = asyncio.Lock()
+
+
+async def get_message_bus() -> MessageBus:
+    """Shared, initialized Message Bus reused across tests."""
+    global _message_bus
+    
+    async with _message_bus_lock:
+        if _message_bus is None:
+            message_bus = MessageBus()
+            await message_bus.initialize()
+            _message_bus = message_bus
+    return _message_bus
+
+
+async def close_message_bus() -> None:
+    """Shut down the shared Message Bus if a test started it."""
+    global _message_bus
+    
+    if _message_bus is not None:
+        await _message_bus.shutdown()
+        _message_bus = None
+
+
 async def test_manager_agent():
     """Test Manager Agent functionality."""
     
-    print("\n🧪 Testing Manager Agent...")
+    out = []
     
-    manager = ManagerAgent("manager-001")
+    out.append("\n🧪 Testing Manager Agent...")
+    
+    manager = get_manager("manager-001")
     
     # Test task assignment
     task = {
@@ -56,17 +138,14 @@ async def test_manager_agent():
         "priority": "high"
     }
     
-    context = AgentContext(
-        project_id="test-project-001",
-        sprint_id="sprint-001"
-    )
+    context = ctx_for("test-project-001", "sprint-001")
     
     result = await manager.process_task(task, context)
     
     if result.get("status") == "success":
-        print("✅ Manager Agent task assignment works")
+        out.append("✅ Manager Agent task assignment works")
     else:
-        print("❌ Manager Agent task assignment failed")
+        out.append("❌ Manager Agent task assignment failed")
     
     # Test work validation
     validation_task = {
@@ -84,17 +163,21 @@ async def test_manager_agent():
     validation_result = await manager.process_task(validation_task, context)
     
     if validation_result.get("approved"):
-        print("✅ Manager Agent work validation works")
+        out.append("✅ Manager Agent work validation works")
     else:
-        print("❌ Manager Agent work validation failed")
+        out.append("❌ Manager Agent work validation failed")
+    
+    return "\n".join(out)
 
 
 async def test_sprint_memory():
     """Test Sprint Memory Management."""
     
-    print("\n🧪 Testing Sprint Memory System...")
+    out = []
+    
+    out.append("\n🧪 Testing Sprint Memory System...")
     
-    memory_manager = SprintMemoryManager()
+    memory_manager = get_memory_manager()
     
     # Initialize sprint memory
     await memory_manager.initialize_sprint_memory(
@@ -126,18 +209,21 @@ async def test_sprint_memory():
     )
     
     if context and "sprint_goal" in context:
-        print("✅ Sprint Memory System works")
+        out.append("✅ Sprint Memory System works")
     else:
-        print("❌ Sprint Memory System failed")
+        out.append("❌ Sprint Memory System failed")
+    
+    return "\n".join(out)
 
 
 async def test_project_manager():
     """Test Multi-Project Management."""
     
-    print("\n🧪 Testing Project Manager...")
+    out = []
     
-    memory_manager = SprintMemoryManager()
-    project_manager = ProjectManager(memory_manager)
+    out.append("\n🧪 Testing Project Manager...")
+    
+    project_manager = get_project_manager()
     
     # Create test project
     config = ProjectConfig(
@@ -152,34 +238,37 @@ async def test_project_manager():
     project_id = await project_manager.create_project(config, ["dev-001", "qa-001", "pm-001"])
     
     if project_id:
-        print("✅ Project creation works")
+        out.append("✅ Project creation works")
         
         # Test project status
         status = await project_manager.get_project_status(project_id)
         if status and status["name"] == "E-commerce Platform":
-            print("✅ Project status retrieval works")
+            out.append("✅ Project status retrieval works")
         else:
-            print("❌ Project status retrieval failed")
+            out.append("❌ Project status retrieval failed")
             
         # Test agent workload
         workload = await project_manager.get_agent_workload("dev-001")
         if workload["agent_id"] == "dev-001":
-            print("✅ Agent workload tracking works")
+            out.append("✅ Agent workload tracking works")
         else:
-            print("❌ Agent workload tracking failed")
+            out.append("❌ Agent workload tracking failed")
     else:
-        print("❌ Project creation failed")
+        out.append("❌ Project creation failed")
+    
+    return "\n".join(out)
 
 
 async def test_message_bus():
     """Test Agent Communication System."""
     
-    print("\n🧪 Testing Message Bus...")
+    out = []
+    
+    out.append("\n🧪 Testing Message Bus...")
     
     try:
         # Initialize message bus
-        message_bus = MessageBus()
-        await message_bus.initialize()
+        message_bus = await get_message_bus()
         
         # Register test agents
         dev_handler = TestMessageHandler("dev-001")
@@ -206,42 +295,42 @@ async def test_message_bus():
         success = await message_bus.send_message(task_message)
         
         if success:
-            print("✅ Message sending works")
+            out.append("✅ Message sending works")
             
-            # Process messages
-            await asyncio.sleep(1)  # Allow message processing
+            # Process messages once dev-001's inbox has them
+            await message_bus.wait_for_messages("dev-001", timeout=0.5)
             await message_bus.process_agent_messages("dev-001")
             
             if len(dev_handler.received_messages) > 0:
-                print("✅ Message receiving works")
+                out.append("✅ Message receiving works")
             else:
-                print("❌ Message receiving failed")
+                out.append("❌ Message receiving failed")
         else:
-            print("❌ Message sending failed")
+            out.append("❌ Message sending failed")
         
         # Get statistics
         stats = await message_bus.get_bus_statistics()
-        print(f"📊 Message Bus Stats: {stats['delivery_stats']}")
-        
-        # Cleanup
-        await message_bus.shutdown()
+        out.append(f"📊 Message Bus Stats: {stats['delivery_stats']}")
         
     except Exception as e:
         logger.error(f"Message bus test failed: {str(e)}")
-        print("❌ Message Bus test failed")
+        out.append("❌ Message Bus test failed")
+    
+    return "\n".join(out)
 
 
 async def test_full_workflow():
     """Test complete workflow simulation."""
     
-    print("\n🧪 Testing Full Agent Team Workflow...")
+    out = []
+    
+    out.append("\n🧪 Testing Full Agent Team Workflow...")
     
     try:
         # Initialize components
-        memory_manager = SprintMemoryManager()
-        project_manager = ProjectManager(memory_manager)
-        message_bus = MessageBus()
-        await message_bus.initialize()
+        memory_manager = get_memory_manager()
+        project_manager = get_project_manager()
+        await get_message_bus()
         
         # Create project
         config = ProjectConfig(
@@ -263,76 +352,70 @@ async def test_full_workflow():
         )
         
         # Create manager agent
-        manager = ManagerAgent("manager-001")
+        manager = get_manager("manager-001")
         
         # Simulate sprint planning
-        planning_task = {
-            "type": "sprint_planning",
-            "sprint_goal": "Implement secure login and account overview",
-            "user_stories": [
-                {
-                    "id": "US-001",
-                    "title": "User Login with 2FA",
-                    "description": "As a user, I want to login securely with 2FA",
-                    "points": 8,
-                    "priority": "high"
-                },
-                {
-                    "id": "US-002", 
-                    "title": "Account Balance Display",
-                    "description": "As a user, I want to see my account balance",
-                    "points": 5,
-                    "priority": "medium"
-                }
-            ]
-        }
-        
-        context = AgentContext(project_id=project_id, sprint_id="sprint-001")
-        result = await manager.process_task(planning_task, context)
+        context = ctx_for(project_id, "sprint-001")
+        result = await manager.process_task(_PLANNING_TASK, context)
         
         if result.get("status") == "success":
-            print("✅ Full workflow simulation works")
+            out.append("✅ Full workflow simulation works")
             
             # Show sprint plan summary
             sprint_plan = result.get("sprint_plan", {})
-            print(f"📋 Sprint Goal: {sprint_plan.get('goal', 'N/A')}")
-            print(f"📊 Total Story Points: {sprint_plan.get('timeline', {}).get('total_story_points', 0)}")
-            print(f"👥 Team Assignments: {len(sprint_plan.get('assignments', {}))}")
+            out.append(f"📋 Sprint Goal: {sprint_plan.get('goal', 'N/A')}")
+            out.append(f"📊 Total Story Points: {sprint_plan.get('timeline', {}).get('total_story_points', 0)}")
+            out.append(f"👥 Team Assignments: {len(sprint_plan.get('assignments', {}))}")
             
         else:
-            print("❌ Full workflow simulation failed")
-        
-        await message_bus.shutdown()
+            out.append("❌ Full workflow simulation failed")
         
     except Exception as e:
         logger.error(f"Full workflow test failed: {str(e)}")
-        print("❌ Full workflow test failed")
+        out.append("❌ Full workflow test failed")
+    
+    return "\n".join(out)
 
 
-async def main():
-    """Run all system tests."""
+async def main() -> bool:
+    """Run all system tests and return whether every report passed."""
+    
+    setup_logging()
     
     print("🚀 AI Agent Team - Full System Test")
     print("=" * 50)
     
-    # Run individual component tests
-    await test_manager_agent()
-    await test_sprint_memory()
-    await test_project_manager()
-    await test_message_bus()
+    # Component tests touch unrelated state, so run them concurrently and
+    # print each report in order
+    tests = (
+        test_manager_agent,
+        test_sprint_memory,
+        test_project_manager,
+        test_message_bus,
+    )
+    reports = await run_tests(*(test() for test in tests))
+    
+    try:
+        # Run full workflow test
+        workflow_report = await test_full_workflow()
+    finally:
+        await close_message_bus()
+    
+    # Emit every report in one write instead of a print per line
+    reports.append(workflow_report)
+    sys.stdout.write("\n".join(reports) + "\n")
+    sys.stdout.flush()
     
-    # Run full workflow test
-    await test_full_workflow()
+    sys.stdout.write("\n".join([
+        "\n" + "=" * 50,
+        "🎉 System tests completed!",
+        "\nThe AI Agent Development Team is ready for use!",
+        NEXT_STEPS,
+    ]) + "\n")
     
-    print("\n" + "=" * 50)
-    print("🎉 System tests completed!")
-    print("\nThe AI Agent Development Team is ready for use!")
-    print("\nNext steps:")
-    print("1. Start databases: docker-compose up -d")
-    print("2. Initialize database: python scripts/setup_database.py")
-    print("3. Start API server: python -m src.main")
-    print("4. Create your first project: python -m src.cli create-project")
+    # The tests report failures as ❌ lines rather than raising
+    return not any("❌" in report for report in reports)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    sys.exit(0 if run(main()) else 1)
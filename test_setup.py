@@ -1,21 +1,35 @@
 #!/usr/bin/env python3
 """Quick setup test to verify all components are working."""
 
+import contextlib
+import importlib
+import io
 import sys
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+from tests._footer import NEXT_STEPS
+
+# Top-level packages checked by test_imports
+_SETUP_MODULES = ("src.config", "src.utils", "src.agents.base", "src.core.database")
 
 def test_imports():
     """Test that all imports work correctly."""
     print("🧪 Testing imports...")
     
     try:
+        # Load the packages on worker threads so their source reads and
+        # bytecode loads overlap; the per-module import locks keep shared
+        # dependencies such as src.config from being initialized twice
+        with ThreadPoolExecutor(max_workers=len(_SETUP_MODULES)) as executor:
+            list(executor.map(importlib.import_module, _SETUP_MODULES))
+        
         from src.config import settings
         print("✅ Config loaded successfully")
         
-        from src.utils import get_logger
+        from src.utils import get_logger, setup_logging
+        setup_logging()
         logger = get_logger(__name__)
         logger.info("Logger working correctly")
         print("✅ Logger working")
@@ -44,14 +58,13 @@ def test_settings():
         print(f"API Port: {settings.api_port}")
         
         # Test LLM configurations
-        deepseek_config = settings.get_llm_config("deepseek")
-        print(f"DeepSeek API configured: {'✅' if deepseek_config['api_key'] else '❌'}")
-        
-        qwen_config = settings.get_llm_config("qwen-max")
-        print(f"Qwen API configured: {'✅' if qwen_config['api_key'] else '❌'}")
-        
-        local_config = settings.get_llm_config("local")
-        print(f"Local LM Studio: {local_config['base_url']}")
+        configs = {
+            provider: settings.get_llm_config(provider)
+            for provider in ("deepseek", "qwen-max", "local")
+        }
+        print(f"DeepSeek API configured: {'✅' if configs['deepseek']['api_key'] else '❌'}")
+        print(f"Qwen API configured: {'✅' if configs['qwen-max']['api_key'] else '❌'}")
+        print(f"Local LM Studio: {configs['local']['base_url']}")
         
         print("✅ Settings test passed")
         return True
@@ -92,6 +105,27 @@ def test_agent_creation():
         print(f"❌ Agent creation test failed: {str(e)}")
         return False
 
+class _ThreadLocalStdout(io.TextIOBase):
+    """Stdout stand-in that sends each thread's writes to its own buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._stream).write(text)
+    
+    def flush(self) -> None:
+        getattr(self._local, "buffer", self._stream).flush()
+    
+    def capture(self, test: Callable[[], bool]) -> Tuple[bool, str]:
+        """Run a test on the calling thread and return its result and output."""
+        self._local.buffer = io.StringIO()
+        try:
+            return test(), self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
 def main():
     """Run all tests."""
     print("🚀 AI Agent Team - Setup Test")
@@ -103,20 +137,21 @@ def main():
         test_agent_creation,
     ]
     
-    passed = 0
-    for test in tests:
-        if test():
-            passed += 1
+    # Each test prints into its own buffer while they run side by side on
+    # worker threads; the reports are then written out in test order
+    stdout = _ThreadLocalStdout(sys.stdout)
+    with contextlib.redirect_stdout(stdout):
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            outcomes = list(executor.map(stdout.capture, tests))
+    
+    sys.stdout.write("".join(report for _, report in outcomes))
+    passed = sum(result for result, _ in outcomes)
     
     print(f"\n📊 Test Results: {passed}/{len(tests)} passed")
     
     if passed == len(tests):
         print("\n🎉 All tests passed! The system is ready to use.")
-        print("\nNext steps:")
-        print("1. Start databases: docker-compose up -d")
-        print("2. Initialize database: python scripts/setup_database.py")
-        print("3. Check status: python -m src.cli status")
-        print("4. Create a project: python -m src.cli create-project")
+        sys.stdout.write(NEXT_STEPS + "\n")
         return True
     else:
         print("\n❌ Some tests failed. Please check the errors above.")
@@ -5,9 +5,13 @@ import os
 import sys
 from pathlib import Path
 
+# 视为"未配置"的API密钥占位值
+_PLACEHOLDERS = frozenset({"", "your_api_key_here", "REPLACE_ME"})
+
 # 加载本地配置
 sys.path.append(str(Path(__file__).parent / "config"))
 
+config_loaded = True
 try:
     from local_settings import LLM_CONFIGS, AGENT_LLM_MAPPING
     print("✅ 成功加载本地配置")
@@ -16,13 +20,13 @@ try:
     
     # 测试API密钥是否配置
     for name, config in LLM_CONFIGS.items():
-        api_key = config.get("api_key", "")
-        if api_key and api_key != "your_api_key_here":
+        if (config.get("api_key") or "") not in _PLACEHOLDERS:
             print(f"✅ {name} API密钥已配置")
         else:
             print(f"⚠️ {name} API密钥未配置")
             
 except ImportError:
+    config_loaded = False
     print("❌ 未找到本地配置文件")
     print("💡 请先运行: python scripts/restore_local_config.py")
 
@@ -36,8 +40,7 @@ env_vars = [
 
 print("\n🔍 检查环境变量:")
 for var in env_vars:
-    value = os.getenv(var)
-    if value:
+    if value := os.getenv(var):
         # 只显示前8个字符，保护敏感信息
         masked_value = value[:8] + "..." if len(value) > 8 else value
         print(f"✅ {var}: {masked_value}")
@@ -49,3 +52,7 @@ print("1. 确保.env文件包含你的实际API密钥")
 print("2. 运行数据库: docker-compose up -d postgres redis")
 print("3. 初始化数据库: python scripts/setup_database.py")
 print("4. 开始测试: python test_core_system.py")
+
+# 缺少本地配置时以非零状态退出，供 run_all_tests.py 判断
+if __name__ == "__main__":
+    sys.exit(0 if config_loaded else 1)
@@ -0,0 +1 @@
+"""Shared helpers for the script-style test files in the project root."""
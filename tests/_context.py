@@ -0,0 +1,14 @@
+"""Agent contexts shared by the script-style test files."""
+
+import functools
+
+from src.agents.base import AgentContext
+
+
+@functools.lru_cache(maxsize=None)
+def ctx_for(project_id: str, sprint_id: str) -> AgentContext:
+    """Shared context per project/sprint pair, validated only once.
+    
+    Agents only read the context, so one instance is safe to reuse.
+    """
+    return AgentContext(project_id=project_id, sprint_id=sprint_id)
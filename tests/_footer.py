@@ -0,0 +1,10 @@
+"""Closing text shared by the setup and full-system test scripts."""
+
+NEXT_STEPS = "\n".join([
+    "\nNext steps:",
+    "1. Start databases: docker-compose up -d",
+    "2. Initialize database: python scripts/setup_database.py",
+    "3. Check status: python -m src.cli status",
+    "4. Start API server: python -m src.main",
+    "5. Create your first project: python -m src.cli create-project",
+])
@@ -0,0 +1,84 @@
+"""Event loop runner shared by the script-style test files."""
+
+import asyncio
+import atexit
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the fastest available event loop for a test run."""
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    
+    # Python 3.12+: run tasks inline until their first real suspension
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    
+    return loop
+
+
+# One loop per process, so several scripts run in the same interpreter
+# (see tests.all) share its selector and default executor
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _close_loop() -> None:
+    """Close the shared loop at interpreter exit."""
+    if _loop is not None and not _loop.is_closed():
+        _loop.close()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared loop, creating it on first use."""
+    global _loop
+    
+    if _loop is None or _loop.is_closed():
+        if _loop is None:
+            atexit.register(_close_loop)
+        _loop = new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a script's main() coroutine on the shared loop."""
+    return get_loop().run_until_complete(main)
+
+
+def failed_report(name: str, error: BaseException) -> str:
+    """Report text for a test that raised instead of returning its report."""
+    return f"\n❌ {name} raised: {error!r}"
+
+
+async def run_tests(
+    *tests: Awaitable[T],
+    limit: Optional[int] = None,
+    on_error: Callable[[str, BaseException], T] = failed_report,
+) -> List[T]:
+    """Run test coroutines concurrently and return their results in order.
+    
+    Every test runs to completion even when another raises. A test that
+    raises is replaced in the results by ``on_error(name, error)``, a ❌
+    report line by default. ``limit`` bounds how many tests run at once.
+    """
+    names = [getattr(test, "__name__", repr(test)) for test in tests]
+    
+    if limit is not None:
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def bounded(test):
+            async with semaphore:
+                return await test
+        
+        tests = tuple(bounded(test) for test in tests)
+    
+    results = await asyncio.gather(*tests, return_exceptions=True)
+    return [
+        on_error(name, result) if isinstance(result, BaseException) else result
+        for name, result in zip(names, results)
+    ]
@@ -0,0 +1,26 @@
+"""Run the setup, quick verification and full system scripts in one process.
+
+The scripts share one interpreter and one event loop, so imports and loop
+setup are paid once.
+
+Usage:
+    python -m tests.all
+"""
+
+import sys
+
+import test_full_system
+import test_quick_verification
+import test_setup
+from tests._runner import run
+
+
+def main() -> int:
+    setup_ok = test_setup.main()
+    verification_ok = run(test_quick_verification.main())
+    system_ok = run(test_full_system.main())
+    return 0 if setup_ok and verification_ok and system_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())